@@ -7,16 +7,16 @@ from alembic import context
 
 # Import your models' Base
 from app.database import Base
-from app.config import settings
+from app.config import get_settings
 
 # Import all models to ensure they're registered with Base
-from app.models import user, auth_token, meeting
+from app.models import user, auth_token, meeting, meeting_participant
 
 # this is the Alembic Config object
 config = context.config
 
 # Override sqlalchemy.url with our settings
-config.set_main_option("sqlalchemy.url", settings.database_url)
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
 
 # Interpret the config file for Python logging.
 if config.config_file_name is not None:
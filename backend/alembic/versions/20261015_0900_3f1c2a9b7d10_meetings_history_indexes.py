@@ -0,0 +1,40 @@
+"""meetings history indexes
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_meetings_user_status_created",
+        "meetings",
+        ["user_id", "status", "created_at"],
+        if_not_exists=True
+    )
+    op.create_index(
+        "ix_meetings_user_created",
+        "meetings",
+        ["user_id", "created_at"],
+        if_not_exists=True
+    )
+    op.drop_index("ix_meetings_status", table_name="meetings", if_exists=True)
+    op.drop_index("ix_meetings_created_at", table_name="meetings", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_meetings_created_at", "meetings", ["created_at"], if_not_exists=True)
+    op.create_index("ix_meetings_status", "meetings", ["status"], if_not_exists=True)
+    op.drop_index("ix_meetings_user_created", table_name="meetings", if_exists=True)
+    op.drop_index("ix_meetings_user_status_created", table_name="meetings", if_exists=True)
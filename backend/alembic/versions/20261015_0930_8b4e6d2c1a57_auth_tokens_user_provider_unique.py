@@ -0,0 +1,30 @@
+"""auth tokens user provider unique
+
+Revision ID: 8b4e6d2c1a57
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e6d2c1a57'
+down_revision = '3f1c2a9b7d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "uq_auth_tokens_user_provider",
+        "auth_tokens",
+        ["user_id", "provider"],
+        unique=True,
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_auth_tokens_user_provider", table_name="auth_tokens", if_exists=True)
@@ -0,0 +1,83 @@
+"""meeting participants table
+
+Revision ID: c7d9e1f40b26
+Revises: 8b4e6d2c1a57
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import json
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d9e1f40b26'
+down_revision = '8b4e6d2c1a57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    
+    # Databases bootstrapped with create_all already have the table
+    if inspector.has_table("meeting_participants"):
+        participants = sa.table(
+            "meeting_participants",
+            sa.column("meeting_id", sa.String(36)),
+            sa.column("position", sa.Integer()),
+            sa.column("email", sa.String(255)),
+            sa.column("name", sa.String(255)),
+        )
+    else:
+        participants = op.create_table(
+            "meeting_participants",
+            sa.Column("meeting_id", sa.String(36), sa.ForeignKey("meetings.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("position", sa.Integer(), primary_key=True),
+            sa.Column("email", sa.String(255), nullable=True),
+            sa.Column("name", sa.String(255), nullable=True),
+        )
+    op.create_index("ix_meeting_participants_email", "meeting_participants", ["email"], if_not_exists=True)
+    
+    # ... and no longer have the JSON column to migrate
+    if "participants" not in {column["name"] for column in inspector.get_columns("meetings")}:
+        return
+    
+    # Move the JSON participant lists into rows
+    conn = op.get_bind()
+    rows = []
+    for meeting_id, data in conn.execute(sa.text("SELECT id, participants FROM meetings")):
+        if isinstance(data, str):
+            data = json.loads(data)
+        for position, p in enumerate(data or []):
+            rows.append({
+                "meeting_id": meeting_id,
+                "position": position,
+                "email": p.get("email"),
+                "name": p.get("name")
+            })
+    if rows:
+        op.bulk_insert(participants, rows)
+    
+    with op.batch_alter_table("meetings") as batch_op:
+        batch_op.drop_column("participants")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("meetings") as batch_op:
+        batch_op.add_column(sa.Column("participants", sa.JSON(), nullable=False, server_default="[]"))
+    
+    conn = op.get_bind()
+    grouped = {}
+    for meeting_id, email, name in conn.execute(sa.text(
+        "SELECT meeting_id, email, name FROM meeting_participants ORDER BY meeting_id, position"
+    )):
+        grouped.setdefault(meeting_id, []).append({"email": email, "name": name})
+    for meeting_id, data in grouped.items():
+        conn.execute(
+            sa.text("UPDATE meetings SET participants = :data WHERE id = :id"),
+            {"data": json.dumps(data), "id": meeting_id}
+        )
+    
+    op.drop_index("ix_meeting_participants_email", table_name="meeting_participants", if_exists=True)
+    op.drop_table("meeting_participants")
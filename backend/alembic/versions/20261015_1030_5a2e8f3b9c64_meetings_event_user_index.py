@@ -0,0 +1,38 @@
+"""meetings event user index
+
+Revision ID: 5a2e8f3b9c64
+Revises: c7d9e1f40b26
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a2e8f3b9c64'
+down_revision = 'c7d9e1f40b26'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction on PostgreSQL
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_meetings_event_user",
+            "meetings",
+            ["event_id", "user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_meetings_event_user",
+            table_name="meetings",
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,25 @@
+"""drop meetings user_id index
+
+Revision ID: e3b7c9d21f48
+Revises: 5a2e8f3b9c64
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b7c9d21f48'
+down_revision = '5a2e8f3b9c64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covered by the leftmost column of the (user_id, ...) composite indexes
+    op.drop_index("ix_meetings_user_id", table_name="meetings", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_meetings_user_id", "meetings", ["user_id"], if_not_exists=True)
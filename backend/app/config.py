@@ -3,6 +3,7 @@ Application Configuration
 Centralized configuration management using Pydantic Settings
 """
 from pydantic_settings import BaseSettings
+from functools import lru_cache
 from typing import Optional
 import os
 
@@ -38,5 +39,10 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings
+    Loaded on first use and cached for the lifetime of the process
+    """
+    return Settings()
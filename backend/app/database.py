@@ -2,19 +2,59 @@
 Database Configuration
 SQLAlchemy setup and session management
 """
-from sqlalchemy import create_engine
+from functools import lru_cache
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from app.config import settings
+from sqlalchemy.orm import Session, sessionmaker
+from app.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Get the database engine
+    Created on first use so importing the app does not require settings
+    """
+    database_url = get_settings().database_url
+    
+    engine = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False} if "sqlite" in database_url else {}
+    )
+    
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            """Use WAL so history reads don't block behind concurrent writes"""
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+            cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+            cursor.close()
+    
+    return engine
+
+
+class LazyBoundSession(Session):
+    """Session that binds to the application engine when it first needs a connection"""
+    
+    def get_bind(self, *args, **kwargs):
+        if self.bind is None:
+            self.bind = get_engine()
+        return super().get_bind(*args, **kwargs)
 
-# Create database engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects keep their loaded state after commit; services return them without re-SELECTing
+SessionLocal = sessionmaker(
+    class_=LazyBoundSession,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base class for models
 Base = declarative_base()
@@ -2,5 +2,6 @@
 from app.models.user import User
 from app.models.auth_token import AuthToken
 from app.models.meeting import Meeting
+from app.models.meeting_participant import MeetingParticipant
 
-__all__ = ["User", "AuthToken", "Meeting"]
+__all__ = ["User", "AuthToken", "Meeting", "MeetingParticipant"]
@@ -2,12 +2,13 @@
 AuthToken Model
 Stores encrypted OAuth tokens for users
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import uuid
 
 from app.database import Base
+from app.models.types import GUID
+from app.utils.ids import uuid7
 
 
 class AuthToken(Base):
@@ -15,8 +16,8 @@ class AuthToken(Base):
     
     __tablename__ = "auth_tokens"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid7()))
+    user_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     provider = Column(String(50), nullable=False, default="google")
     access_token = Column(String, nullable=False)  # Encrypted
     refresh_token = Column(String, nullable=False)  # Encrypted
@@ -24,6 +25,11 @@ class AuthToken(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    # One token row per user and provider (upsert conflict target)
+    __table_args__ = (
+        Index("uq_auth_tokens_user_provider", "user_id", "provider", unique=True),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="auth_tokens")
     
@@ -2,14 +2,13 @@
 Meeting Model
 Stores meeting scheduling requests and confirmed events
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, CheckConstraint, Text
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, CheckConstraint, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import uuid
 
 from app.database import Base
-from app.config import settings
+from app.models.types import GUID
+from app.utils.ids import uuid7
 
 
 class Meeting(Base):
@@ -17,31 +16,40 @@ class Meeting(Base):
     
     __tablename__ = "meetings"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(GUID, primary_key=True, default=lambda: str(uuid7()))
+    user_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
     
-    # Use JSON for SQLite
-    participants = Column(JSON, nullable=False)
-    
     duration_minutes = Column(Integer, nullable=False)
     start_time = Column(DateTime(timezone=True), nullable=True)
     end_time = Column(DateTime(timezone=True), nullable=True)
     timezone = Column(String(100), nullable=False)
     event_id = Column(String(255), nullable=True)  # Google Calendar event ID
-    status = Column(String(50), nullable=False, default="proposed", index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    status = Column(String(50), nullable=False, default="proposed")
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
-    # Constraints
+    # Constraints and indexes
     __table_args__ = (
         CheckConstraint("status IN ('proposed', 'confirmed', 'cancelled')", name="check_status"),
         CheckConstraint("duration_minutes > 0", name="check_duration_positive"),
+        # Meeting history: filter by user (and optionally status), newest first
+        Index("ix_meetings_user_status_created", "user_id", "status", "created_at"),
+        Index("ix_meetings_user_created", "user_id", "created_at"),
+        # Calendar event deletes: look up the meeting by event and owner
+        Index("ix_meetings_event_user", "event_id", "user_id"),
     )
     
     # Relationships
     user = relationship("User", back_populates="meetings")
+    participants = relationship(
+        "MeetingParticipant",
+        back_populates="meeting",
+        order_by="MeetingParticipant.position",
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
     
     def __repr__(self):
         return f"<Meeting(id={self.id}, title={self.title}, status={self.status})>"
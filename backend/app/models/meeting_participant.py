@@ -0,0 +1,31 @@
+"""
+MeetingParticipant Model
+Stores the participants invited to a meeting
+"""
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+from app.models.types import GUID
+
+
+class MeetingParticipant(Base):
+    """MeetingParticipant model, one row per participant of a meeting"""
+    
+    __tablename__ = "meeting_participants"
+    
+    meeting_id = Column(GUID, ForeignKey("meetings.id", ondelete="CASCADE"), primary_key=True)
+    position = Column(Integer, primary_key=True)  # Order as given in the request
+    email = Column(String(255), nullable=True)
+    name = Column(String(255), nullable=True)
+    
+    # Look up meetings by participant email
+    __table_args__ = (
+        Index("ix_meeting_participants_email", "email"),
+    )
+    
+    # Relationships
+    meeting = relationship("Meeting", back_populates="participants")
+    
+    def __repr__(self):
+        return f"<MeetingParticipant(meeting_id={self.meeting_id}, email={self.email}, name={self.name})>"
@@ -0,0 +1,23 @@
+"""
+Column Types
+Custom SQLAlchemy column types shared by the models
+"""
+from sqlalchemy import String
+from sqlalchemy.types import TypeDecorator
+
+
+class GUID(TypeDecorator):
+    """
+    UUID stored as a 36-character string
+    
+    Binds uuid.UUID or str values so callers can filter with UUIDs directly;
+    loaded values stay strings, matching how IDs are used in the app.
+    """
+    
+    impl = String(36)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return str(value)
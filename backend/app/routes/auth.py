@@ -2,22 +2,26 @@
 Authentication Routes
 Google OAuth 2.0 login and callback handlers
 """
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
 from google_auth_oauthlib.flow import Flow
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 
 from app.database import get_db
-from app.config import settings
+from app.config import get_settings
 from app.models.user import User
 from app.models.auth_token import AuthToken
-from app.utils.encryption import encryption_service
+from app.services.google_calendar import invalidate_credentials
+from app.utils.encryption import get_encryption_service
 from app.utils.jwt import create_access_token
 from app.schemas.user import UserSchema
+from app.routes.dependencies import get_authenticated_user
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -32,22 +36,38 @@ SCOPES = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _google_client_config() -> dict:
+    """OAuth client config shared by the login and callback flows"""
+    settings = get_settings()
+    return {
+        "web": {
+            "client_id": settings.google_client_id,
+            "client_secret": settings.google_client_secret,
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "redirect_uris": [settings.google_redirect_uri]
+        }
+    }
+
+
+def _upsert_insert(db: Session):
+    """Dialect-specific INSERT construct that supports ON CONFLICT DO UPDATE"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
 @router.get("/google/login")
 async def google_login():
     """
     Initiate Google OAuth flow
     Returns authorization URL for user to visit
     """
+    settings = get_settings()
+    
     flow = Flow.from_client_config(
-        {
-            "web": {
-                "client_id": settings.google_client_id,
-                "client_secret": settings.google_client_secret,
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": [settings.google_redirect_uri]
-            }
-        },
+        _google_client_config(),
         scopes=SCOPES,
         redirect_uri=settings.google_redirect_uri
     )
@@ -76,18 +96,12 @@ async def google_callback(
     Handle Google OAuth callback
     Exchange authorization code for tokens and create/update user
     """
+    settings = get_settings()
+    
     try:
         # Exchange authorization code for tokens
         flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": settings.google_client_id,
-                    "client_secret": settings.google_client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [settings.google_redirect_uri]
-                }
-            },
+            _google_client_config(),
             scopes=SCOPES,
             redirect_uri=settings.google_redirect_uri,
             state=state
@@ -103,50 +117,48 @@ async def google_callback(
         email = user_info.get("email")
         name = user_info.get("name")
         
-        # Create or update user
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            user = User(email=email, name=name)
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-            logger.info(f"Created new user: {email}")
-        else:
-            user.name = name
-            user.updated_at = datetime.utcnow()
-            db.commit()
-            logger.info(f"Updated existing user: {email}")
+        insert = _upsert_insert(db)
+        now = datetime.utcnow()
         
-        # Store or update auth tokens (user.id is already a string in SQLite)
-        auth_token = db.query(AuthToken).filter(
-            AuthToken.user_id == user.id,
-            AuthToken.provider == "google"
-        ).first()
+        # Create or update user in a single upsert keyed on email
+        user_stmt = insert(User).values(email=email, name=name)
+        user_stmt = user_stmt.on_conflict_do_update(
+            index_elements=[User.email],
+            set_={"name": user_stmt.excluded.name, "updated_at": now}
+        ).returning(User.id)
+        user_id = db.execute(user_stmt).scalar_one()
+        logger.info(f"Upserted user: {email}")
         
         # Encrypt tokens before storing
-        encrypted_access = encryption_service.encrypt(credentials.token)
-        encrypted_refresh = encryption_service.encrypt(credentials.refresh_token)
+        encrypted_access = get_encryption_service().encrypt(credentials.token)
+        encrypted_refresh = get_encryption_service().encrypt(credentials.refresh_token)
         
-        if not auth_token:
-            auth_token = AuthToken(
-                user_id=user.id,
-                provider="google",
-                access_token=encrypted_access,
-                refresh_token=encrypted_refresh,
-                token_expiry=credentials.expiry
-            )
-            db.add(auth_token)
-        else:
-            auth_token.access_token = encrypted_access
-            auth_token.refresh_token = encrypted_refresh
-            auth_token.token_expiry = credentials.expiry
-            auth_token.updated_at = datetime.utcnow()
+        # Store or update auth tokens keyed on (user_id, provider)
+        token_stmt = insert(AuthToken).values(
+            user_id=user_id,
+            provider="google",
+            access_token=encrypted_access,
+            refresh_token=encrypted_refresh,
+            token_expiry=credentials.expiry
+        )
+        token_stmt = token_stmt.on_conflict_do_update(
+            index_elements=[AuthToken.user_id, AuthToken.provider],
+            set_={
+                "access_token": token_stmt.excluded.access_token,
+                "refresh_token": token_stmt.excluded.refresh_token,
+                "token_expiry": token_stmt.excluded.token_expiry,
+                "updated_at": now
+            }
+        )
+        db.execute(token_stmt)
         
         db.commit()
-        logger.info(f"Stored auth tokens for user {user.id}")
+        # Re-consent may replace revoked tokens; stop serving the cached ones
+        invalidate_credentials(user_id)
+        logger.info(f"Stored auth tokens for user {user_id}")
         
         # Create JWT for session
-        jwt_token = create_access_token(user.id)
+        jwt_token = create_access_token(user_id)
         
         # Redirect to frontend with token
         redirect_url = f"{settings.frontend_url}/auth/callback?token={jwt_token}"
@@ -159,30 +171,9 @@ async def google_callback(
 
 
 @router.get("/me", response_model=UserSchema)
-async def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db)
-):
+async def get_current_user(user: User = Depends(get_authenticated_user)):
     """
     Get current authenticated user
     Requires JWT token in Authorization header
     """
-    from app.utils.jwt import decode_access_token
-    
-    # Get token from Authorization header
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing or invalid authorization header")
-    
-    token = auth_header.split(" ")[1]
-    user_id = decode_access_token(token)
-    
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-    
-    # Convert UUID to string for SQLite comparison
-    user = db.query(User).filter(User.id == str(user_id)).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
     return user
@@ -0,0 +1,68 @@
+"""
+Route Dependencies
+Shared FastAPI dependencies for authenticated endpoints
+"""
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+from uuid import UUID
+from cachetools import TTLCache
+import time
+
+from app.database import get_db
+from app.models.user import User
+from app.utils.jwt import decode_access_token_with_expiry
+
+# Verified tokens mapped to (user_id, exp), so repeat requests skip the signature check
+_token_cache = TTLCache(maxsize=50_000, ttl=30)
+
+
+async def get_current_user_id(request: Request) -> UUID:
+    """
+    Dependency to get current user ID from JWT
+    The decoded ID is cached on request.state so the token is verified once per request
+    """
+    user_id = getattr(request.state, "user_id", None)
+    if user_id is not None:
+        return user_id
+    
+    auth_header = request.headers.get("Authorization")
+    if not auth_header or not auth_header.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Missing or invalid authorization header")
+    
+    token = auth_header.split(" ")[1]
+    cached = _token_cache.get(token)
+    if cached is not None and cached[1] > time.time():
+        user_id = cached[0]
+    else:
+        _token_cache.pop(token, None)
+        decoded = decode_access_token_with_expiry(token)
+        if not decoded:
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        if decoded[1] is not None:
+            _token_cache[token] = decoded
+        user_id = decoded[0]
+    
+    request.state.user_id = user_id
+    return user_id
+
+
+def get_authenticated_user(
+    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Dependency to load the current user record
+    Cached on request.state so the user is loaded once per request
+    """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+    
+    # Identity-map keys are the loaded string IDs, so look up by the string form
+    user = db.get(User, str(user_id))
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    request.state.user = user
+    return user
@@ -2,7 +2,7 @@
 Meetings Routes
 Meeting history and management endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
@@ -11,27 +11,12 @@ import logging
 from app.database import get_db
 from app.schemas.meeting import MeetingSchema
 from app.services.meeting import MeetingService
-from app.utils.jwt import decode_access_token
+from app.routes.dependencies import get_current_user_id
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def get_current_user_id(request: Request) -> UUID:
-    """Dependency to get current user ID from JWT"""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing or invalid authorization header")
-    
-    token = auth_header.split(" ")[1]
-    user_id = decode_access_token(token)
-    
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-    
-    return user_id
-
-
 @router.get("/meetings/history", response_model=List[MeetingSchema])
 async def get_meetings_history(
     status: Optional[str] = Query(None, description="Filter by status (proposed, confirmed, cancelled)"),
@@ -78,15 +63,11 @@ async def get_meeting(
     """
     try:
         meeting_service = MeetingService(db)
-        meeting = meeting_service.get_meeting_by_id(meeting_id)
+        meeting = meeting_service.get_user_meeting(meeting_id, user_id)
         
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
         
-        # Verify meeting belongs to user (convert to string for comparison with SQLite)
-        if str(meeting.user_id) != str(user_id):
-            raise HTTPException(status_code=403, detail="Access denied")
-        
         logger.info(f"Retrieved meeting {meeting_id} for user {user_id}")
         
         return meeting
@@ -112,17 +93,11 @@ async def cancel_meeting(
     """
     try:
         meeting_service = MeetingService(db)
-        meeting = meeting_service.get_meeting_by_id(meeting_id)
+        cancelled_meeting = meeting_service.cancel_meeting(meeting_id, user_id)
         
-        if not meeting:
+        if not cancelled_meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
         
-        # Verify meeting belongs to user (convert to string for comparison with SQLite)
-        if str(meeting.user_id) != str(user_id):
-            raise HTTPException(status_code=403, detail="Access denied")
-        
-        cancelled_meeting = meeting_service.cancel_meeting(meeting_id)
-        
         logger.info(f"Cancelled meeting {meeting_id} for user {user_id}")
         
         return {
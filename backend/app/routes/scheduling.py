@@ -2,46 +2,94 @@
 Scheduling Routes
 Intent parsing, slot proposal, and event creation endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
-from datetime import datetime, timedelta
+from typing import List, Optional
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from types import MappingProxyType
+from cachetools import TTLCache
+import asyncio
 import logging
+import pytz
 
-from app.database import get_db
-from app.schemas.intent import ParseIntentRequest, ParseIntentResponse
+from app.database import get_db, SessionLocal
+from app.schemas.intent import IntentSchema, ParseIntentRequest, ParseIntentResponse, TimeWindowSchema
 from app.schemas.slot import ProposeSlotsRequest, ProposeSlotsResponse
-from app.schemas.meeting import CreateEventRequest, CreateEventResponse
+from app.schemas.meeting import CreateEventRequest, CreateEventResponse, CreateEventResult
 from app.services.intent_extraction import IntentExtractionService
 from app.services.google_calendar import GoogleCalendarService
-from app.services.slot_proposer import SlotProposerService
+from app.services.slot_proposer import SlotProposerService, invalidate_busy_periods
 from app.services.meeting import MeetingService
-from app.utils.jwt import decode_access_token
+from app.routes.dependencies import get_current_user_id
+from app.utils.dates import parse_iso
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+UTC = pytz.UTC
+ONE_SECOND = timedelta(seconds=1)
+ONE_MINUTE = timedelta(minutes=1)
 
-def get_current_user_id(request: Request) -> UUID:
-    """Dependency to get current user ID from JWT"""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing or invalid authorization header")
-    
-    token = auth_header.split(" ")[1]
-    user_id = decode_access_token(token)
-    
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-    
-    return user_id
+# pytz.timezone resolver, cached per timezone name
+_get_timezone = lru_cache(maxsize=512)(pytz.timezone)
+
+# Shared read-only default for users with nothing cached
+_EMPTY = MappingProxyType({})
+
+# Day availability responses per user, each user's cache keyed by (date, timezone)
+DAY_AVAILABILITY_TTL = 60
+_day_availability_cache = TTLCache(maxsize=10_000, ttl=DAY_AVAILABILITY_TTL)
+
+
+def _cache_day_availability(user_id: UUID, key: tuple, result: dict) -> None:
+    """Store a day availability response; re-setting the user's entry renews its TTL"""
+    user_cache = _day_availability_cache.get(user_id)
+    if user_cache is None:
+        user_cache = TTLCache(maxsize=64, ttl=DAY_AVAILABILITY_TTL)
+    user_cache[key] = result
+    _day_availability_cache[user_id] = user_cache
+
+
+def _delete_events(calendar_service: GoogleCalendarService, user_id: UUID, event_ids: List[str]) -> None:
+    """Best-effort removal of events whose meeting could not be confirmed"""
+    for event_id in event_ids:
+        try:
+            if not calendar_service.delete_event(user_id=user_id, event_id=event_id):
+                logger.warning("Could not delete orphaned event %s", event_id)
+        except Exception as e:
+            logger.warning("Could not delete orphaned event %s: %s", event_id, e)
+
+
+def _invalidate_calendar_caches(user_id: UUID) -> None:
+    """Drop cached day availability and busy periods for a user after their calendar changes"""
+    _day_availability_cache.pop(user_id, None)
+    invalidate_busy_periods(user_id)
+
+
+def _record_proposed_meeting(user_id: UUID, intent: IntentSchema, timezone: str) -> None:
+    """Create the 'proposed' meeting for a parsed intent after the response is sent"""
+    # The request session is closed by then, so use a dedicated one
+    try:
+        with SessionLocal() as session:
+            meeting = MeetingService(session).create_meeting(
+                user_id=user_id,
+                intent=intent,
+                timezone=timezone
+            )
+        logger.info("Parsed intent and created meeting %s for user %s", meeting.id, user_id)
+    except Exception as e:
+        logger.error("Failed to record parsed intent for user %s: %s", user_id, e)
 
 
 @router.post("/parse-intent", response_model=ParseIntentResponse)
 async def parse_intent(
     request_data: ParseIntentRequest,
-    user_id: UUID = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    user_id: UUID = Depends(get_current_user_id)
 ):
     """
     Parse natural language scheduling request into structured intent
@@ -55,25 +103,25 @@ async def parse_intent(
     try:
         intent_service = IntentExtractionService()
         
-        intent = intent_service.extract_intent(
+        # Gemini call is blocking; run it in the threadpool so the event loop stays free
+        intent = await run_in_threadpool(
+            intent_service.extract_intent,
             prompt=request_data.prompt,
             user_timezone=request_data.user_timezone
         )
         
-        # Create a meeting record with status 'proposed'
-        meeting_service = MeetingService(db)
-        meeting = meeting_service.create_meeting(
+        # Create a meeting record with status 'proposed' once the response is sent
+        background_tasks.add_task(
+            _record_proposed_meeting,
             user_id=user_id,
             intent=intent,
             timezone=request_data.user_timezone
         )
         
-        logger.info(f"Parsed intent and created meeting {meeting.id} for user {user_id}")
-        
         return intent
         
     except Exception as e:
-        logger.error(f"Failed to parse intent: {str(e)}")
+        logger.error("Failed to parse intent: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to parse intent: {str(e)}")
 
 
@@ -99,12 +147,12 @@ async def propose_slots(
             preferred_windows=request_data.preferred_windows
         )
         
-        logger.info(f"Proposed {len(slots)} slots for user {user_id}")
+        logger.info("Proposed %s slots for user %s", len(slots), user_id)
         
         return ProposeSlotsResponse(slots=slots)
         
     except Exception as e:
-        logger.error(f"Failed to propose slots: {str(e)}")
+        logger.error("Failed to propose slots: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to propose slots: {str(e)}")
 
 
@@ -120,16 +168,58 @@ async def get_day_availability(
     Returns list of hourly slots with busy/free status
     """
     try:
-        import pytz
-        
         calendar_service = GoogleCalendarService(db)
         
         # Parse the date string (YYYY-MM-DD format)
         date_parts = date.split('T')[0]  # Get just the date part
         year, month, day = map(int, date_parts.split('-'))
         
+        # Serve repeated polls for the same day from the cache
+        cache_key = (date_parts, timezone)
+        cached = _day_availability_cache.get(user_id, _EMPTY).get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(content=cached)
+        
         # Create timezone-aware datetime for the user's timezone
-        user_tz = pytz.timezone(timezone)
+        user_tz = _get_timezone(timezone)
+        
+        # Fetch the whole 9 AM - 6 PM window in one Calendar API call,
+        # off the event loop since the Google client is blocking
+        day_start_local = user_tz.localize(datetime(year, month, day, 9, 0, 0))
+        last_hour_local = user_tz.localize(datetime(year, month, day, 17, 0, 0))
+        day_start_utc = day_start_local.astimezone(UTC)
+        day_end_utc = (last_hour_local + timedelta(hours=1)).astimezone(UTC)
+        
+        # Business hours share one UTC offset unless DST shifts mid-day, so
+        # format free periods against a fixed offset instead of pytz rules
+        day_offset = day_start_local.utcoffset()
+        if day_offset == last_hour_local.utcoffset():
+            local_tz = dt_timezone(day_offset)
+        else:
+            local_tz = user_tz
+        try:
+            day_events = await run_in_threadpool(
+                calendar_service.list_events_in_slot,
+                user_id=user_id,
+                start_time=day_start_utc,
+                end_time=day_end_utc
+            )
+            fetched = True
+        except Exception as e:
+            # Still answer with the day's hours, but never cache them as free
+            logger.error("Failed to get events for day availability: %s", e)
+            day_events = []
+            fetched = False
+        
+        # Parse event boundaries once into parallel lists (the Calendar API
+        # already orders events by start time), then bucket them into hours
+        event_starts = [parse_iso(event["start"]) for event in day_events]
+        event_ends = [parse_iso(event["end"]) for event in day_events]
+        
+        # Sweep the hours in order: events are admitted once their start falls
+        # before the hour ends and dropped once they end before it begins
+        active_indices = []
+        next_event = 0
         
         # Generate hourly slots from 9 AM to 6 PM in user's timezone
         slots = []
@@ -138,66 +228,59 @@ async def get_day_availability(
             slot_start = user_tz.localize(datetime(year, month, day, hour, 0, 0))
             slot_end = slot_start + timedelta(hours=1)
             
-            # Convert to UTC for calendar API
-            slot_start_utc = slot_start.astimezone(pytz.UTC)
-            slot_end_utc = slot_end.astimezone(pytz.UTC)
+            # Convert to UTC for comparison with event times
+            slot_start_utc = slot_start.astimezone(UTC)
+            slot_end_utc = slot_end.astimezone(UTC)
             
-            # Get event details for this slot
-            events = calendar_service.get_events_in_slot(
-                user_id=user_id,
-                start_time=slot_start_utc,
-                end_time=slot_end_utc
-            )
+            # Events overlapping this hour (same rule the Calendar API applies)
+            while next_event < len(day_events) and event_starts[next_event] < slot_end_utc:
+                active_indices.append(next_event)
+                next_event += 1
+            slot_indices = active_indices = [
+                i for i in active_indices if event_ends[i] > slot_start_utc
+            ]
+            events = [day_events[i] for i in slot_indices]
             
             # Calculate busy and free time within the hour
-            is_busy = len(events) > 0
-            busy_minutes = 0
+            is_busy = bool(events)
+            busy_seconds = 0
             free_minutes = 60
             free_periods = []
             
             if events:
-                # Sort events by start time
-                sorted_events = sorted(events, key=lambda e: e["start"])
-                
-                # Find free periods between events
+                # Find free periods between events (already sorted by start time)
                 current_time = slot_start_utc
                 
-                for event in sorted_events:
-                    event_start = datetime.fromisoformat(event["start"].replace('Z', '+00:00'))
-                    event_end = datetime.fromisoformat(event["end"].replace('Z', '+00:00'))
-                    
+                for i in slot_indices:
                     # Clip to slot boundaries
-                    event_start = max(event_start, slot_start_utc)
-                    event_end = min(event_end, slot_end_utc)
+                    event_start = max(event_starts[i], slot_start_utc)
+                    event_end = min(event_ends[i], slot_end_utc)
                     
                     # Check if there's free time before this event
                     if current_time < event_start:
-                        free_start = current_time.astimezone(user_tz)
-                        free_end = event_start.astimezone(user_tz)
-                        free_duration = (event_start - current_time).total_seconds() / 60
+                        free_start = current_time.astimezone(local_tz)
+                        free_end = event_start.astimezone(local_tz)
                         free_periods.append({
                             "start": free_start.isoformat(),
                             "end": free_end.isoformat(),
-                            "duration_minutes": int(free_duration)
+                            "duration_minutes": (event_start - current_time) // ONE_MINUTE
                         })
                     
-                    # Update current time and busy minutes
-                    duration = (event_end - event_start).total_seconds() / 60
-                    busy_minutes += duration
+                    # Update current time and busy time
+                    busy_seconds += (event_end - event_start) // ONE_SECOND
                     current_time = max(current_time, event_end)
                 
                 # Check if there's free time after the last event
                 if current_time < slot_end_utc:
-                    free_start = current_time.astimezone(user_tz)
-                    free_end = slot_end_utc.astimezone(user_tz)
-                    free_duration = (slot_end_utc - current_time).total_seconds() / 60
+                    free_start = current_time.astimezone(local_tz)
+                    free_end = slot_end_utc.astimezone(local_tz)
                     free_periods.append({
                         "start": free_start.isoformat(),
                         "end": free_end.isoformat(),
-                        "duration_minutes": int(free_duration)
+                        "duration_minutes": (slot_end_utc - current_time) // ONE_MINUTE
                     })
                 
-                free_minutes = 60 - busy_minutes
+                free_minutes = int(60 - busy_seconds / 60)
             else:
                 # Entire hour is free
                 free_periods.append({
@@ -207,9 +290,9 @@ async def get_day_availability(
                 })
             
             # Determine status
-            if busy_minutes == 0:
+            if busy_seconds == 0:
                 status = "available"
-            elif busy_minutes >= 60:
+            elif busy_seconds >= 3600:
                 status = "busy"
             else:
                 status = "partial"
@@ -219,21 +302,30 @@ async def get_day_availability(
                 "end": slot_end.isoformat(),
                 "is_busy": is_busy,
                 "status": status,
-                "busy_minutes": int(busy_minutes),
+                "busy_minutes": busy_seconds // 60,
                 "free_minutes": int(free_minutes),
                 "free_periods": free_periods,
                 "hour": hour,
                 "events": events
             })
         
-        logger.info(f"Retrieved day availability for user {user_id} on {date} in {timezone}")
-        return {"slots": slots}
+        logger.info("Retrieved day availability for user %s on %s in %s", user_id, date, timezone)
+        result = {"slots": slots}
+        if fetched:
+            _cache_day_availability(user_id, cache_key, result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
-        logger.error(f"Failed to get day availability: {str(e)}")
+        logger.error("Failed to get day availability: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get day availability: {str(e)}")
 
 
+def _find_event_meeting_id(event_id: str, user_id: UUID) -> Optional[str]:
+    """Look up the meeting for a calendar event on its own session (safe off-thread)"""
+    with SessionLocal() as lookup_db:
+        return MeetingService(lookup_db).get_meeting_id_by_event(event_id, user_id)
+
+
 @router.delete("/delete-event/{event_id}")
 async def delete_event(
     event_id: str,
@@ -247,35 +339,59 @@ async def delete_event(
         calendar_service = GoogleCalendarService(db)
         meeting_service = MeetingService(db)
         
-        # Delete from Google Calendar
-        success = calendar_service.delete_event(
-            user_id=user_id,
-            event_id=event_id
+        # Delete from Google Calendar while looking up the meeting record
+        success, meeting_id = await asyncio.gather(
+            run_in_threadpool(
+                calendar_service.delete_event,
+                user_id=user_id,
+                event_id=event_id
+            ),
+            run_in_threadpool(_find_event_meeting_id, event_id, user_id)
         )
         
         if success:
-            # Find and delete the meeting record from database
-            from app.models.meeting import Meeting
-            meeting = db.query(Meeting).filter(
-                Meeting.event_id == event_id,
-                Meeting.user_id == str(user_id)
-            ).first()
+            _invalidate_calendar_caches(user_id)
             
-            if meeting:
-                meeting_service.delete_meeting(UUID(meeting.id))
-                logger.info(f"Deleted event {event_id} and meeting {meeting.id} for user {user_id}")
+            # Delete the meeting record from database
+            if meeting_id:
+                meeting_service.delete_meeting(meeting_id)
+                logger.info("Deleted event %s and meeting %s for user %s", event_id, meeting_id, user_id)
             else:
-                logger.info(f"Deleted event {event_id} for user {user_id} (no meeting record found)")
+                logger.info("Deleted event %s for user %s (no meeting record found)", event_id, user_id)
             
-            return {"success": True, "message": "Event deleted successfully"}
+            return ORJSONResponse(content={"success": True, "message": "Event deleted successfully"})
         else:
             raise HTTPException(status_code=500, detail="Failed to delete event")
         
     except Exception as e:
-        logger.error(f"Failed to delete event: {str(e)}")
+        logger.error("Failed to delete event: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete event: {str(e)}")
 
 
+def _calendar_link(event: dict) -> str:
+    """Use the htmlLink from Google Calendar API response, falling back to the event edit URL"""
+    return event.get("htmlLink") or f"https://calendar.google.com/calendar/u/0/r/eventedit/{event['id']}"
+
+
+def _slot_intent(request_data: CreateEventRequest) -> IntentSchema:
+    """Build the intent for a new meeting from the selected slot"""
+    start_dt = request_data.slot.start
+    end_dt = request_data.slot.end
+    
+    # Create a time window from the selected slot
+    time_window = TimeWindowSchema(
+        start=start_dt,
+        end=end_dt
+    )
+    return IntentSchema(
+        title=request_data.title,
+        description=request_data.description,
+        participants=request_data.participants,
+        duration_minutes=(end_dt - start_dt) // ONE_MINUTE,
+        preferred_windows=[time_window]
+    )
+
+
 @router.post("/create-event", response_model=CreateEventResponse)
 async def create_event(
     request_data: CreateEventRequest,
@@ -294,88 +410,56 @@ async def create_event(
         calendar_service = GoogleCalendarService(db)
         meeting_service = MeetingService(db)
         
+        # Slot boundaries are validated into datetimes by SlotSchema
+        start_dt = request_data.slot.start
+        end_dt = request_data.slot.end
+        
         # Prepare attendees list
         attendees = [
             {"email": p.email} for p in request_data.participants if p.email
         ]
         
-        # Datetime strings come from frontend (naive datetime - no timezone)
+        # Datetimes come from frontend (naive datetime - no timezone)
         # Use GMT+5:30 (Asia/Kolkata) timezone
-        start_str = str(request_data.slot.start)
-        end_str = str(request_data.slot.end)
-        
         # Create Google Calendar event with GMT+5:30 timezone
         # This ensures 9 AM is interpreted as 9 AM GMT+5:30
-        event = calendar_service.create_event(
+        event = await calendar_service.acreate_event(
             user_id=user_id,
             title=request_data.title,
             description=request_data.description,
-            start_time=start_str,
-            end_time=end_str,
+            start_time=start_dt,
+            end_time=end_dt,
             attendees=attendees,
             timezone="Asia/Kolkata"  # GMT+5:30
         )
         
         event_id = event["id"]
-        # Use the htmlLink from Google Calendar API response, or construct a proper link
-        calendar_link = event.get("htmlLink")
-        if not calendar_link:
-            # Fallback: use the event ID in the proper format
-            calendar_link = f"https://calendar.google.com/calendar/u/0/r/eventedit/{event_id}"
-        
-        # Parse datetime strings to datetime objects for database
-        if isinstance(request_data.slot.start, str):
-            start_dt_db = datetime.fromisoformat(request_data.slot.start.replace('Z', '+00:00'))
-            end_dt_db = datetime.fromisoformat(request_data.slot.end.replace('Z', '+00:00'))
-        else:
-            start_dt_db = request_data.slot.start
-            end_dt_db = request_data.slot.end
+        _invalidate_calendar_caches(user_id)
+        calendar_link = _calendar_link(event)
         
         # Create or update meeting record
         if request_data.meeting_id:
             meeting = meeting_service.confirm_meeting(
                 meeting_id=request_data.meeting_id,
-                start_time=start_dt_db,
-                end_time=end_dt_db,
+                start_time=start_dt,
+                end_time=end_dt,
                 event_id=event_id
             )
         else:
             # Create new meeting if no ID provided
-            from app.schemas.intent import IntentSchema, TimeWindowSchema
-            
-            # Parse datetime strings if needed
-            if isinstance(request_data.slot.start, str):
-                start_dt = datetime.fromisoformat(request_data.slot.start.replace('Z', '+00:00'))
-                end_dt = datetime.fromisoformat(request_data.slot.end.replace('Z', '+00:00'))
-            else:
-                start_dt = request_data.slot.start
-                end_dt = request_data.slot.end
-            
-            # Create a time window from the selected slot
-            time_window = TimeWindowSchema(
-                start=start_dt,
-                end=end_dt
-            )
-            intent = IntentSchema(
-                title=request_data.title,
-                description=request_data.description,
-                participants=request_data.participants,
-                duration_minutes=int((end_dt - start_dt).total_seconds() / 60),
-                preferred_windows=[time_window]
-            )
             meeting = meeting_service.create_meeting(
                 user_id=user_id,
-                intent=intent,
+                intent=_slot_intent(request_data),
                 timezone="UTC"
             )
             meeting = meeting_service.confirm_meeting(
                 meeting_id=meeting.id,
-                start_time=start_dt_db,
-                end_time=end_dt_db,
+                start_time=start_dt,
+                end_time=end_dt,
                 event_id=event_id
             )
         
-        logger.info(f"Created event {event_id} and confirmed meeting {meeting.id}")
+        logger.info("Created event %s and confirmed meeting %s", event_id, meeting.id)
         
         return CreateEventResponse(
             event_id=event_id,
@@ -384,5 +468,116 @@ async def create_event(
         )
         
     except Exception as e:
-        logger.error(f"Failed to create event: {str(e)}")
+        logger.error("Failed to create event: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create event: {str(e)}")
+
+
+@router.post("/create-events", response_model=List[CreateEventResult])
+async def create_events(
+    requests_data: List[CreateEventRequest],
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """
+    Create several Google Calendar events in one call
+    
+    Events are inserted through Google Calendar batch requests and the
+    meeting records are confirmed in a single transaction. The response has
+    one result per input item, in input order; items whose meeting is not
+    found or that Google rejects are reported with status "failed".
+    """
+    try:
+        calendar_service = GoogleCalendarService(db)
+        meeting_service = MeetingService(db)
+        
+        results: List[Optional[CreateEventResult]] = [None] * len(requests_data)
+        
+        # Reject unknown meetings before creating their events, so nothing is orphaned
+        owned_ids = meeting_service.get_user_meeting_ids(
+            user_id, [r.meeting_id for r in requests_data if r.meeting_id]
+        )
+        pending = []
+        for index, request_data in enumerate(requests_data):
+            if request_data.meeting_id and request_data.meeting_id not in owned_ids:
+                results[index] = CreateEventResult(
+                    status="failed",
+                    error=f"Meeting {request_data.meeting_id} not found"
+                )
+            else:
+                pending.append(index)
+        
+        created = []
+        if pending:
+            # Same event shape as /create-event, in GMT+5:30 (Asia/Kolkata)
+            events = [
+                {
+                    "title": requests_data[index].title,
+                    "description": requests_data[index].description,
+                    "start_time": requests_data[index].slot.start,
+                    "end_time": requests_data[index].slot.end,
+                    "attendees": [
+                        {"email": p.email} for p in requests_data[index].participants if p.email
+                    ]
+                }
+                for index in pending
+            ]
+            created_events = await run_in_threadpool(
+                calendar_service.create_events,
+                user_id=user_id,
+                events=events,
+                timezone="Asia/Kolkata"  # GMT+5:30
+            )
+            _invalidate_calendar_caches(user_id)
+            
+            for index, event in zip(pending, created_events):
+                if event is None:
+                    results[index] = CreateEventResult(status="failed", error="Failed to create event")
+                else:
+                    created.append((index, event))
+        
+        meeting_ids = meeting_service.confirm_meetings(
+            user_id=user_id,
+            confirmations=[
+                {
+                    "meeting_id": requests_data[index].meeting_id,
+                    "intent": None if requests_data[index].meeting_id else _slot_intent(requests_data[index]),
+                    "start_time": requests_data[index].slot.start,
+                    "end_time": requests_data[index].slot.end,
+                    "event_id": event["id"]
+                }
+                for index, event in created
+            ],
+            timezone="UTC"
+        ) if created else []
+        
+        orphaned = []
+        for (index, event), meeting_id in zip(created, meeting_ids):
+            if meeting_id:
+                results[index] = CreateEventResult(
+                    status="created",
+                    event_id=event["id"],
+                    calendar_link=_calendar_link(event),
+                    meeting_id=meeting_id
+                )
+            else:
+                # The meeting went away between the ownership check and the confirm
+                orphaned.append(event["id"])
+                results[index] = CreateEventResult(
+                    status="failed",
+                    error=f"Meeting {requests_data[index].meeting_id} not found"
+                )
+        
+        if orphaned:
+            await run_in_threadpool(_delete_events, calendar_service, user_id, orphaned)
+            _invalidate_calendar_caches(user_id)
+        
+        logger.info(
+            "Created %s of %s events for user %s",
+            len(created) - len(orphaned), len(requests_data), user_id
+        )
+        
+        return results
+        
+    except Exception as e:
+        logger.error("Failed to create events: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to create events: {str(e)}")
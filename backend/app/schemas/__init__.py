@@ -13,7 +13,8 @@ from app.schemas.meeting import (
     MeetingCreate,
     MeetingUpdate,
     CreateEventRequest,
-    CreateEventResponse
+    CreateEventResponse,
+    CreateEventResult
 )
 
 __all__ = [
@@ -32,4 +33,5 @@ __all__ = [
     "MeetingUpdate",
     "CreateEventRequest",
     "CreateEventResponse",
+    "CreateEventResult",
 ]
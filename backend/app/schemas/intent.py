@@ -2,23 +2,26 @@
 Intent Extraction Schemas
 Pydantic models for natural language intent parsing
 """
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import List, Optional
 
+from app.schemas.user import EmailAddress
+
 
 class ParticipantSchema(BaseModel):
     """Schema for meeting participant"""
-    email: Optional[EmailStr] = None
+    email: Optional[EmailAddress] = None
     name: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "alice@example.com",
                 "name": "Alice Smith"
             }
         }
+    )
 
 
 class TimeWindowSchema(BaseModel):
@@ -26,13 +29,14 @@ class TimeWindowSchema(BaseModel):
     start: datetime
     end: datetime
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "start": "2024-01-15T09:00:00+00:00",
                 "end": "2024-01-15T18:00:00+00:00"
             }
         }
+    )
 
 
 class IntentSchema(BaseModel):
@@ -43,8 +47,8 @@ class IntentSchema(BaseModel):
     duration_minutes: int = Field(..., gt=0, le=480)  # Max 8 hours
     preferred_windows: List[TimeWindowSchema] = Field(..., min_length=1)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Sync meeting with Alice",
                 "description": "Quick catch-up on project status",
@@ -60,6 +64,7 @@ class IntentSchema(BaseModel):
                 ]
             }
         }
+    )
 
 
 class ParseIntentRequest(BaseModel):
@@ -67,13 +72,14 @@ class ParseIntentRequest(BaseModel):
     prompt: str = Field(..., min_length=1, max_length=1000)
     user_timezone: str = Field(default="UTC")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "prompt": "Schedule a 30-minute sync with alice@example.com tomorrow afternoon",
                 "user_timezone": "America/New_York"
             }
         }
+    )
 
 
 class ParseIntentResponse(IntentSchema):
@@ -2,7 +2,7 @@
 Meeting Schemas
 Pydantic models for meeting data validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
@@ -45,9 +45,9 @@ class MeetingSchema(MeetingBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
                 "user_id": "123e4567-e89b-12d3-a456-426614174001",
@@ -66,6 +66,7 @@ class MeetingSchema(MeetingBase):
                 "updated_at": "2024-01-14T10:05:00+00:00"
             }
         }
+    )
 
 
 class CreateEventRequest(BaseModel):
@@ -76,8 +77,8 @@ class CreateEventRequest(BaseModel):
     participants: List[ParticipantSchema] = Field(default_factory=list)
     meeting_id: Optional[UUID] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "slot": {
                     "start": "2024-01-15T14:00:00+00:00",
@@ -92,6 +93,7 @@ class CreateEventRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 class CreateEventResponse(BaseModel):
@@ -100,11 +102,33 @@ class CreateEventResponse(BaseModel):
     calendar_link: str
     meeting_id: UUID
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "event_id": "abc123xyz",
                 "calendar_link": "https://calendar.google.com/calendar/event?eid=abc123xyz",
                 "meeting_id": "123e4567-e89b-12d3-a456-426614174000"
             }
         }
+    )
+
+
+class CreateEventResult(BaseModel):
+    """Per-item result of a batch event creation"""
+    status: str  # "created" or "failed"
+    event_id: Optional[str] = None
+    calendar_link: Optional[str] = None
+    meeting_id: Optional[UUID] = None
+    error: Optional[str] = None
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "status": "created",
+                "event_id": "abc123xyz",
+                "calendar_link": "https://calendar.google.com/calendar/event?eid=abc123xyz",
+                "meeting_id": "123e4567-e89b-12d3-a456-426614174000",
+                "error": None
+            }
+        }
+    )
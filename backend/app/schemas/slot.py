@@ -2,7 +2,7 @@
 Slot Schemas
 Pydantic models for time slot proposals
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import List
 from uuid import UUID
@@ -10,17 +10,15 @@ from uuid import UUID
 from app.schemas.intent import ParticipantSchema, TimeWindowSchema
 
 
-from typing import Union
-
 class SlotSchema(BaseModel):
     """Schema for a proposed time slot"""
-    start: Union[datetime, str]
-    end: Union[datetime, str]
+    start: datetime
+    end: datetime
     score: float = Field(..., ge=0.0, le=1.0)
     conflicts: List[str] = Field(default_factory=list)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "start": "2024-01-15T14:00:00+00:00",
                 "end": "2024-01-15T14:30:00+00:00",
@@ -28,6 +26,7 @@ class SlotSchema(BaseModel):
                 "conflicts": []
             }
         }
+    )
 
 
 class ProposeSlotsRequest(BaseModel):
@@ -36,8 +35,8 @@ class ProposeSlotsRequest(BaseModel):
     duration_minutes: int = Field(..., gt=0)
     preferred_windows: List[TimeWindowSchema]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "participants": [
                     {"email": "alice@example.com", "name": "Alice"}
@@ -51,14 +50,15 @@ class ProposeSlotsRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 class ProposeSlotsResponse(BaseModel):
     """Response schema for proposed slots"""
     slots: List[SlotSchema] = Field(..., min_length=0, max_length=3)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "slots": [
                     {
@@ -70,3 +70,4 @@ class ProposeSlotsResponse(BaseModel):
                 ]
             }
         }
+    )
@@ -2,15 +2,18 @@
 User Schemas
 Pydantic models for user data validation
 """
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, constr
 from datetime import datetime
 from uuid import UUID
 from typing import Optional
 
+# Lightweight email check: compiled once by pydantic-core instead of email-validator per value
+EmailAddress = constr(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class UserBase(BaseModel):
     """Base user schema"""
-    email: EmailStr
+    email: EmailAddress
     name: Optional[str] = None
 
 
@@ -25,5 +28,4 @@ class UserSchema(UserBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
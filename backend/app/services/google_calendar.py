@@ -3,20 +3,151 @@ Google Calendar Service
 Handles all interactions with Google Calendar API
 """
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Union
+from cachetools import TLRUCache
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.models.auth_token import AuthToken
-from app.utils.encryption import encryption_service
-from app.config import settings
+from app.utils.encryption import get_encryption_service
+from app.config import get_settings
+from app.utils.dates import parse_iso
+import asyncio
+import httplib2
+import httpx
 import logging
+import threading
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# OAuth scopes granted at login
+SCOPES = [
+    "openid",
+    "https://www.googleapis.com/auth/userinfo.email",
+    "https://www.googleapis.com/auth/userinfo.profile",
+    "https://www.googleapis.com/auth/calendar.readonly",
+    "https://www.googleapis.com/auth/calendar.events"
+]
+
+# Shared read-only default for missing response sections
+_EMPTY = MappingProxyType({})
+
+# Maximum number of calls Google accepts in one batch request
+BATCH_LIMIT = 50
+
+# Upper bound on how long decrypted credentials stay cached (seconds)
+MAX_CREDENTIALS_TTL = 600
+
+
+def _credentials_ttu(_key, value, now):
+    """Expire cached credentials 30s before their access token, and within MAX_CREDENTIALS_TTL"""
+    remaining = (value[1] - datetime.utcnow()).total_seconds() - 30
+    return now + min(MAX_CREDENTIALS_TTL, remaining)
+
+
+# Decrypted credentials keyed by user_id, stored with their token expiry
+_credentials_cache = TLRUCache(maxsize=10_000, ttu=_credentials_ttu)
+_credentials_lock = threading.RLock()
+
+
+def invalidate_credentials(user_id: Union[UUID, str]) -> None:
+    """Drop a user's cached credentials after their stored tokens change"""
+    with _credentials_lock:
+        _credentials_cache.pop(str(user_id), None)
+
+
+# Long-lived httplib2 clients, one per worker thread since httplib2.Http is not thread-safe
+_thread_local = threading.local()
+
+
+def _shared_http() -> httplib2.Http:
+    """Return this thread's keep-alive HTTP client so Google calls reuse open connections"""
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = _thread_local.http = httplib2.Http()
+    return http
+
+
+# REST endpoint for the async Calendar calls
+CALENDAR_API_URL = "https://www.googleapis.com/calendar/v3"
+
+# Pooled async client shared by the async Calendar calls, created on first use
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client for the Calendar REST API"""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            base_url=CALENDAR_API_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared async HTTP client (application shutdown)"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+# Per-user locks so concurrent requests don't all refresh the same token; an entry
+# disappears once no thread holds or waits on it, so the map stays bounded
+_refresh_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+_refresh_locks_guard = threading.Lock()
+
+
+def _refresh_lock(user_id: str) -> threading.Lock:
+    """Return the token-refresh lock for a user, creating it only if none is live"""
+    with _refresh_locks_guard:
+        lock = _refresh_locks.get(user_id)
+        if lock is None:
+            lock = _refresh_locks[user_id] = threading.Lock()
+        return lock
+
+
+@lru_cache(maxsize=1)
+def _token_request():
+    """
+    Shared transport for OAuth token refreshes
+    The Request wraps one requests.Session, so refreshes reuse its connection pool
+    """
+    from google.auth.transport.requests import Request
+    return Request()
+
+
+@lru_cache(maxsize=1)
+def _calendar_service():
+    """
+    Calendar API client built once per process from the bundled discovery document
+    Requests are executed with a per-user authorized http, so the client holds no credentials
+    """
+    return build("calendar", "v3", http=httplib2.Http(), cache_discovery=False, static_discovery=True)
+
+
+def _primary_busy(freebusy_data: Dict[str, Any]):
+    """Busy periods of the primary calendar from a FreeBusy response"""
+    return freebusy_data.get("calendars", _EMPTY).get("primary", _EMPTY).get("busy", ())
+
+
+def _floating_time(value) -> str:
+    """ISO string for a datetime or ISO string, with any UTC offset dropped"""
+    # Handle both datetime objects and strings
+    if hasattr(value, 'isoformat'):
+        return value.replace(tzinfo=None).isoformat()
+    return str(value).partition('+')[0].removesuffix('Z')
+
 
 class GoogleCalendarService:
     """Service for Google Calendar API operations"""
@@ -34,86 +165,87 @@ class GoogleCalendarService:
         Returns:
             Google OAuth2 Credentials object or None
         """
-        # Convert UUID to string for SQLite comparison
+        with _credentials_lock:
+            cached = _credentials_cache.get(str(user_id))
+        if cached is not None:
+            return cached[0]
+        
         auth_token = self.db.query(AuthToken).filter(
-            AuthToken.user_id == str(user_id),
+            AuthToken.user_id == user_id,
             AuthToken.provider == "google"
         ).first()
         
         if not auth_token:
             return None
         
-        # Decrypt tokens
-        access_token = encryption_service.decrypt(auth_token.access_token)
-        refresh_token = encryption_service.decrypt(auth_token.refresh_token)
+        refresh_token = get_encryption_service().decrypt(auth_token.refresh_token)
+        
+        # Check if token needs refresh; the stale access token is never decrypted
+        if auth_token.token_expiry <= datetime.utcnow():
+            return self._refresh_token_locked(auth_token, refresh_token)
+        
+        settings = get_settings()
         
         credentials = Credentials(
-            token=access_token,
+            token=get_encryption_service().decrypt(auth_token.access_token),
             refresh_token=refresh_token,
             token_uri="https://oauth2.googleapis.com/token",
             client_id=settings.google_client_id,
             client_secret=settings.google_client_secret,
-            scopes=[
-                "openid",
-                "https://www.googleapis.com/auth/userinfo.email",
-                "https://www.googleapis.com/auth/userinfo.profile",
-                "https://www.googleapis.com/auth/calendar.readonly",
-                "https://www.googleapis.com/auth/calendar.events"
-            ]
+            scopes=SCOPES
         )
         
-        # Check if token needs refresh
-        if auth_token.token_expiry <= datetime.utcnow():
-            credentials = self.refresh_token(user_id)
-        
+        with _credentials_lock:
+            _credentials_cache[str(user_id)] = (credentials, auth_token.token_expiry)
         return credentials
     
-    def refresh_token(self, user_id: UUID) -> Optional[Credentials]:
+    def _refresh_token_locked(self, auth_token: AuthToken, refresh_token_plain: str) -> Optional[Credentials]:
         """
-        Refresh expired access token
+        Refresh expired access token, one refresh per user at a time
         
         Args:
-            user_id: User UUID
+            auth_token: The user's already-loaded AuthToken row
+            refresh_token_plain: Decrypted refresh token
             
         Returns:
             Updated Credentials object or None
         """
-        # Convert UUID to string for SQLite comparison
-        auth_token = self.db.query(AuthToken).filter(
-            AuthToken.user_id == str(user_id),
-            AuthToken.provider == "google"
-        ).first()
-        
-        if not auth_token:
-            return None
+        user_id = auth_token.user_id
         
-        try:
-            from google.auth.transport.requests import Request
-            
-            refresh_token = encryption_service.decrypt(auth_token.refresh_token)
-            
-            credentials = Credentials(
-                token=None,
-                refresh_token=refresh_token,
-                token_uri="https://oauth2.googleapis.com/token",
-                client_id=settings.google_client_id,
-                client_secret=settings.google_client_secret
-            )
-            
-            # Refresh the token with a proper Request object
-            credentials.refresh(Request())
-            
-            # Update stored tokens
-            auth_token.access_token = encryption_service.encrypt(credentials.token)
-            auth_token.token_expiry = credentials.expiry
-            self.db.commit()
-            
-            logger.info(f"Refreshed token for user {user_id}")
-            return credentials
-            
-        except Exception as e:
-            logger.error(f"Failed to refresh token for user {user_id}: {str(e)}")
-            return None
+        with _refresh_lock(user_id):
+            # A concurrent request may have refreshed while we waited
+            with _credentials_lock:
+                cached = _credentials_cache.get(user_id)
+            if cached is not None:
+                return cached[0]
+            
+            try:
+                settings = get_settings()
+                
+                credentials = Credentials(
+                    token=None,
+                    refresh_token=refresh_token_plain,
+                    token_uri="https://oauth2.googleapis.com/token",
+                    client_id=settings.google_client_id,
+                    client_secret=settings.google_client_secret
+                )
+                
+                # Refresh the token with a proper Request object
+                credentials.refresh(_token_request())
+                
+                # Update stored tokens
+                auth_token.access_token = get_encryption_service().encrypt(credentials.token)
+                auth_token.token_expiry = credentials.expiry
+                self.db.commit()
+                with _credentials_lock:
+                    _credentials_cache[user_id] = (credentials, credentials.expiry)
+                
+                logger.info(f"Refreshed token for user {user_id}")
+                return credentials
+            
+            except Exception as e:
+                logger.error(f"Failed to refresh token for user {user_id}: {str(e)}")
+                return None
     
     def get_freebusy(
         self,
@@ -139,18 +271,7 @@ class GoogleCalendarService:
             raise ValueError("No valid credentials found for user")
         
         try:
-            service = build("calendar", "v3", credentials=credentials)
-            
-            if calendars is None:
-                calendars = ["primary"]
-            
-            body = {
-                "timeMin": time_min.isoformat(),
-                "timeMax": time_max.isoformat(),
-                "items": [{"id": cal} for cal in calendars]
-            }
-            
-            freebusy_result = service.freebusy().query(body=body).execute()
+            freebusy_result = self._fetch_freebusy(credentials, time_min, time_max, calendars)
             
             logger.info(f"Retrieved FreeBusy data for user {user_id}")
             return freebusy_result
@@ -176,18 +297,48 @@ class GoogleCalendarService:
         Returns:
             True if slot has any busy periods, False if free
         """
-        try:
-            freebusy_data = self.get_freebusy(user_id, start_time, end_time)
+        return self.check_slots_busy(user_id, [(start_time, end_time)])[0]
+    
+    def check_slots_busy(
+        self,
+        user_id: UUID,
+        slots: List[Tuple[datetime, datetime]]
+    ) -> List[bool]:
+        """
+        Check several time slots with a single FreeBusy query over their combined range
+        
+        Args:
+            user_id: User UUID
+            slots: (start, end) pairs to check
             
-            # Check if there are any busy periods in the primary calendar
-            busy_periods = freebusy_data.get("calendars", {}).get("primary", {}).get("busy", [])
+        Returns:
+            True for each slot that overlaps a busy period, in input order
+        """
+        if not slots:
+            return []
+        
+        try:
+            freebusy_data = self.get_freebusy(
+                user_id,
+                min(start for start, _ in slots),
+                max(end for _, end in slots)
+            )
             
-            return len(busy_periods) > 0
+            # Busy periods in the primary calendar, bucketed locally per slot
+            busy_periods = [
+                (parse_iso(busy["start"]), parse_iso(busy["end"]))
+                for busy in _primary_busy(freebusy_data)
+            ]
             
         except Exception as e:
             logger.error(f"Failed to check slot busy status: {str(e)}")
             # Default to not busy if check fails
-            return False
+            return [False] * len(slots)
+        
+        return [
+            any(busy_start < end and busy_end > start for busy_start, busy_end in busy_periods)
+            for start, end in slots
+        ]
     
     def get_events_in_slot(
         self,
@@ -206,42 +357,142 @@ class GoogleCalendarService:
         Returns:
             List of event dictionaries with title, description, attendees
         """
-        credentials = self._get_credentials(user_id)
-        if not credentials:
-            return []
-        
         try:
-            service = build("calendar", "v3", credentials=credentials)
-            
-            events_result = service.events().list(
-                calendarId="primary",
-                timeMin=start_time.isoformat(),
-                timeMax=end_time.isoformat(),
-                singleEvents=True,
-                orderBy="startTime"
-            ).execute()
-            
-            events = events_result.get("items", [])
-            
-            event_details = []
-            for event in events:
-                event_details.append({
-                    "id": event.get("id", ""),
-                    "title": event.get("summary", "No Title"),
-                    "description": event.get("description", ""),
-                    "start": event.get("start", {}).get("dateTime", ""),
-                    "end": event.get("end", {}).get("dateTime", ""),
-                    "attendees": [att.get("email", "") for att in event.get("attendees", [])],
-                    "location": event.get("location", ""),
-                    "htmlLink": event.get("htmlLink", "")
-                })
-            
-            return event_details
+            return self.list_events_in_slot(user_id, start_time, end_time)
             
         except Exception as e:
             logger.error(f"Failed to get events in slot: {str(e)}")
             return []
     
+    def list_events_in_slot(
+        self,
+        user_id: UUID,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all events in a specific time slot, raising on failure
+        
+        Args:
+            user_id: User UUID
+            start_time: Slot start time
+            end_time: Slot end time
+            
+        Returns:
+            List of event dictionaries with title, description, attendees
+            
+        Raises:
+            ValueError: If the user has no valid credentials
+            HttpError: If the Calendar API call fails
+        """
+        credentials = self._get_credentials(user_id)
+        if not credentials:
+            raise ValueError("No valid credentials found for user")
+        
+        return self._fetch_events(credentials, start_time, end_time)
+    
+    def _fetch_freebusy(
+        self,
+        credentials: Credentials,
+        time_min: datetime,
+        time_max: datetime,
+        calendars: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Run a FreeBusy query with already-resolved credentials"""
+        service = _calendar_service()
+        http = AuthorizedHttp(credentials, http=_shared_http())
+        
+        if calendars is None:
+            calendars = ["primary"]
+        
+        body = {
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "items": [{"id": cal} for cal in calendars]
+        }
+        
+        return service.freebusy().query(body=body).execute(http=http)
+    
+    def _fetch_events(
+        self,
+        credentials: Credentials,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict[str, Any]]:
+        """List primary-calendar event details with already-resolved credentials"""
+        service = _calendar_service()
+        http = AuthorizedHttp(credentials, http=_shared_http())
+        
+        events_result = service.events().list(
+            calendarId="primary",
+            timeMin=start_time.isoformat(),
+            timeMax=end_time.isoformat(),
+            singleEvents=True,
+            orderBy="startTime"
+        ).execute(http=http)
+        
+        events = events_result.get("items", ())
+        
+        # id, start and end are always present on events.list items;
+        # most events have no attendees, so skip that comprehension
+        return [
+            {
+                "id": event["id"],
+                "title": event.get("summary", "No Title"),
+                "description": event.get("description", ""),
+                "start": event["start"].get("dateTime", ""),
+                "end": event["end"].get("dateTime", ""),
+                "attendees": (
+                    [att.get("email", "") for att in event["attendees"]]
+                    if "attendees" in event else []
+                ),
+                "location": event.get("location", ""),
+                "htmlLink": event.get("htmlLink", "")
+            }
+            for event in events
+        ]
+    
+    def _build_event_body(
+        self,
+        user_id: UUID,
+        title: str,
+        description: Optional[str],
+        start_time,  # Can be datetime or string
+        end_time,  # Can be datetime or string
+        attendees: List[Dict[str, str]],
+        timezone: str,
+        request_suffix: str = ""
+    ) -> Dict[str, Any]:
+        """Build the events.insert body shared by single and batch creation"""
+        # Remove any timezone info to treat the time as "floating time"
+        # This ensures 9 AM in the UI = 9 AM in Google Calendar
+        start_dt_str = _floating_time(start_time)
+        end_dt_str = _floating_time(end_time)
+        
+        logger.info(f"Creating event with start: {start_dt_str}, end: {end_dt_str}, timezone: {timezone}")
+        
+        # Build start/end objects with explicit timezone
+        # Google Calendar will interpret this as "9 AM in the specified timezone"
+        start_obj = {"dateTime": start_dt_str, "timeZone": timezone if timezone else "UTC"}
+        end_obj = {"dateTime": end_dt_str, "timeZone": timezone if timezone else "UTC"}
+        
+        return {
+            "summary": title,
+            "description": description or "",
+            "start": start_obj,
+            "end": end_obj,
+            "attendees": attendees,
+            "conferenceData": {
+                "createRequest": {
+                    "requestId": f"meet-{user_id}-{int(datetime.utcnow().timestamp())}{request_suffix}",
+                    "conferenceSolutionKey": {"type": "hangoutsMeet"}
+                }
+            },
+            "reminders": {
+                "useDefault": True
+            }
+        }
+    
     def create_event(
         self,
         user_id: UUID,
@@ -272,47 +523,19 @@ class GoogleCalendarService:
             raise ValueError("No valid credentials found for user")
         
         try:
-            service = build("calendar", "v3", credentials=credentials)
-            
-            # Handle both datetime objects and strings
-            start_dt_str = start_time.isoformat() if hasattr(start_time, 'isoformat') else str(start_time)
-            end_dt_str = end_time.isoformat() if hasattr(end_time, 'isoformat') else str(end_time)
-            
-            # Remove any timezone info from the string to treat it as "floating time"
-            # This ensures 9 AM in the UI = 9 AM in Google Calendar
-            start_dt_str = start_dt_str.split('+')[0].split('Z')[0]
-            end_dt_str = end_dt_str.split('+')[0].split('Z')[0]
-            
-            logger.info(f"Creating event with start: {start_dt_str}, end: {end_dt_str}, timezone: {timezone}")
+            service = _calendar_service()
+            http = AuthorizedHttp(credentials, http=_shared_http())
             
-            # Build start/end objects with explicit timezone
-            # Google Calendar will interpret this as "9 AM in the specified timezone"
-            start_obj = {"dateTime": start_dt_str, "timeZone": timezone if timezone else "UTC"}
-            end_obj = {"dateTime": end_dt_str, "timeZone": timezone if timezone else "UTC"}
-            
-            event = {
-                "summary": title,
-                "description": description or "",
-                "start": start_obj,
-                "end": end_obj,
-                "attendees": attendees,
-                "conferenceData": {
-                    "createRequest": {
-                        "requestId": f"meet-{user_id}-{int(datetime.utcnow().timestamp())}",
-                        "conferenceSolutionKey": {"type": "hangoutsMeet"}
-                    }
-                },
-                "reminders": {
-                    "useDefault": True
-                }
-            }
+            event = self._build_event_body(
+                user_id, title, description, start_time, end_time, attendees, timezone
+            )
             
             created_event = service.events().insert(
                 calendarId="primary",
                 body=event,
                 conferenceDataVersion=1,
                 sendUpdates="all"
-            ).execute()
+            ).execute(http=http)
             
             logger.info(f"Created event {created_event['id']} for user {user_id}")
             return created_event
@@ -321,6 +544,106 @@ class GoogleCalendarService:
             logger.error(f"Failed to create event: {str(e)}")
             raise
     
+    async def acreate_event(
+        self,
+        user_id: UUID,
+        title: str,
+        description: Optional[str],
+        start_time,  # Can be datetime or string
+        end_time,  # Can be datetime or string
+        attendees: List[Dict[str, str]],
+        timezone: str = "UTC"
+    ) -> Dict[str, Any]:
+        """
+        Create a Google Calendar event without blocking the event loop
+        
+        Async counterpart of create_event over the Calendar REST API
+        
+        Args:
+            user_id: User UUID
+            title: Event title
+            description: Event description
+            start_time: Event start time
+            end_time: Event end time
+            attendees: List of attendee dicts with 'email' key
+            timezone: Timezone string
+            
+        Returns:
+            Created event data
+        """
+        credentials = await asyncio.to_thread(self._get_credentials, user_id)
+        if not credentials:
+            raise ValueError("No valid credentials found for user")
+        
+        event = self._build_event_body(
+            user_id, title, description, start_time, end_time, attendees, timezone
+        )
+        
+        response = await _get_async_client().post(
+            "/calendars/primary/events",
+            params={"conferenceDataVersion": 1, "sendUpdates": "all"},
+            json=event,
+            headers={"Authorization": f"Bearer {credentials.token}"}
+        )
+        if response.is_error:
+            logger.error(f"Failed to create event: {response.text}")
+        response.raise_for_status()
+        
+        created_event = response.json()
+        logger.info(f"Created event {created_event['id']} for user {user_id}")
+        return created_event
+    
+    def create_events(
+        self,
+        user_id: UUID,
+        events: List[Dict[str, Any]],
+        timezone: str = "UTC"
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several Google Calendar events with batched HTTP requests
+        
+        Args:
+            user_id: User UUID
+            events: Dicts with title, description, start_time, end_time and attendees
+            timezone: Timezone string
+            
+        Returns:
+            Created event data in input order, None for events that failed
+        """
+        credentials = self._get_credentials(user_id)
+        if not credentials:
+            raise ValueError("No valid credentials found for user")
+        
+        service = _calendar_service()
+        http = AuthorizedHttp(credentials, http=_shared_http())
+        created: List[Optional[Dict[str, Any]]] = [None] * len(events)
+        
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Failed to create event in batch: {str(exception)}")
+                return
+            created[int(request_id)] = response
+        
+        for batch_start in range(0, len(events), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=_collect)
+            for index in range(batch_start, min(batch_start + BATCH_LIMIT, len(events))):
+                event = self._build_event_body(
+                    user_id, timezone=timezone, request_suffix=f"-{index}", **events[index]
+                )
+                batch.add(
+                    service.events().insert(
+                        calendarId="primary",
+                        body=event,
+                        conferenceDataVersion=1,
+                        sendUpdates="all"
+                    ),
+                    request_id=str(index)
+                )
+            batch.execute(http=http)
+        
+        logger.info(f"Created {sum(e is not None for e in created)}/{len(events)} events for user {user_id}")
+        return created
+    
     def delete_event(
         self,
         user_id: UUID,
@@ -341,13 +664,14 @@ class GoogleCalendarService:
             raise ValueError("No valid credentials found for user")
         
         try:
-            service = build("calendar", "v3", credentials=credentials)
+            service = _calendar_service()
+            http = AuthorizedHttp(credentials, http=_shared_http())
             
             service.events().delete(
                 calendarId="primary",
                 eventId=event_id,
                 sendUpdates="all"  # Send cancellation emails to attendees
-            ).execute()
+            ).execute(http=http)
             
             logger.info(f"Deleted event {event_id} for user {user_id}")
             return True
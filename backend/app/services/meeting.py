@@ -3,12 +3,14 @@ Meeting Service
 Business logic for meeting management
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
 from uuid import UUID
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 import logging
 
 from app.models.meeting import Meeting
+from app.models.meeting_participant import MeetingParticipant
 from app.schemas.meeting import MeetingCreate, MeetingUpdate, MeetingSchema
 from app.schemas.intent import IntentSchema
 
@@ -38,28 +40,31 @@ class MeetingService:
         Returns:
             Created Meeting object
         """
-        # Convert participants to JSON-serializable format
-        participants_data = [
-            {"email": p.email, "name": p.name}
-            for p in intent.participants
+        meeting = self._build_meeting(user_id, intent, timezone)
+        
+        self.db.add(meeting)
+        self.db.commit()
+        
+        logger.info(f"Created meeting {meeting.id} for user {user_id}")
+        return meeting
+    
+    def _build_meeting(self, user_id: UUID, intent: IntentSchema, timezone: str) -> Meeting:
+        """Build an unsaved 'proposed' Meeting with its participant rows"""
+        # One participant row per invitee, keeping request order
+        participants = [
+            MeetingParticipant(position=position, email=p.email, name=p.name)
+            for position, p in enumerate(intent.participants)
         ]
         
-        meeting = Meeting(
-            user_id=str(user_id),  # Convert UUID to string for SQLite
+        return Meeting(
+            user_id=user_id,
             title=intent.title,
             description=intent.description,
-            participants=participants_data,
+            participants=participants,
             duration_minutes=intent.duration_minutes,
             timezone=timezone,
             status="proposed"
         )
-        
-        self.db.add(meeting)
-        self.db.commit()
-        self.db.refresh(meeting)
-        
-        logger.info(f"Created meeting {meeting.id} for user {user_id}")
-        return meeting
     
     def confirm_meeting(
         self,
@@ -80,47 +85,140 @@ class MeetingService:
         Returns:
             Updated Meeting object
         """
-        # Convert UUID to string for SQLite comparison
-        meeting = self.db.query(Meeting).filter(Meeting.id == str(meeting_id)).first()
+        # Single UPDATE ... RETURNING instead of load, mutate and flush
+        stmt = (
+            update(Meeting)
+            .where(Meeting.id == meeting_id)
+            .values(
+                start_time=start_time,
+                end_time=end_time,
+                event_id=event_id,
+                status="confirmed",
+                updated_at=datetime.utcnow()
+            )
+            .returning(Meeting)
+            # Sync an already-loaded instance from the returned row; "evaluate"
+            # can't match the UUID criteria against the string identity
+            .execution_options(synchronize_session="fetch")
+        )
+        meeting = self.db.execute(stmt).scalar_one_or_none()
         
         if not meeting:
+            self.db.rollback()
             raise ValueError(f"Meeting {meeting_id} not found")
         
-        meeting.start_time = start_time
-        meeting.end_time = end_time
-        meeting.event_id = event_id
-        meeting.status = "confirmed"
-        meeting.updated_at = datetime.utcnow()
-        
         self.db.commit()
-        self.db.refresh(meeting)
         
         logger.info(f"Confirmed meeting {meeting_id}")
         return meeting
     
-    def cancel_meeting(self, meeting_id: UUID) -> Meeting:
+    def confirm_meetings(
+        self,
+        user_id: UUID,
+        confirmations: List[Dict[str, Any]],
+        timezone: str
+    ) -> List[Optional[UUID]]:
         """
-        Cancel a meeting
+        Confirm many meetings in a single transaction
         
         Args:
-            meeting_id: Meeting UUID
+            user_id: User UUID
+            confirmations: Dicts with meeting_id (or None), intent, start_time,
+                end_time and event_id; entries without a meeting_id create a
+                new meeting from their intent
+            timezone: Timezone for newly created meetings
             
         Returns:
-            Updated Meeting object
+            Meeting IDs in input order, None where the meeting_id was not
+            found for this user
         """
-        # Convert UUID to string for SQLite comparison
-        meeting = self.db.query(Meeting).filter(Meeting.id == str(meeting_id)).first()
+        now = datetime.utcnow()
+        updates = []
+        meetings = []
         
-        if not meeting:
-            raise ValueError(f"Meeting {meeting_id} not found")
+        # Bulk updates match on primary key alone, so restrict them to the user's own meetings
+        owned_ids = self.get_user_meeting_ids(
+            user_id, [c["meeting_id"] for c in confirmations if c["meeting_id"]]
+        )
         
-        meeting.status = "cancelled"
-        meeting.updated_at = datetime.utcnow()
+        for confirmation in confirmations:
+            values = {
+                "start_time": confirmation["start_time"],
+                "end_time": confirmation["end_time"],
+                "event_id": confirmation["event_id"],
+                "status": "confirmed",
+                "updated_at": now
+            }
+            meeting_id = confirmation["meeting_id"]
+            if meeting_id:
+                if meeting_id in owned_ids:
+                    updates.append({"id": meeting_id, **values})
+                    meetings.append(meeting_id)
+                else:
+                    logger.warning(f"Meeting {meeting_id} not found for user {user_id}")
+                    meetings.append(None)
+            else:
+                meeting = self._build_meeting(user_id, confirmation["intent"], timezone)
+                for key, value in values.items():
+                    setattr(meeting, key, value)
+                self.db.add(meeting)
+                meetings.append(meeting)
         
+        if updates:
+            self.db.bulk_update_mappings(Meeting, updates)
+        # Flush assigns IDs to the new meetings
+        self.db.flush()
+        meeting_ids = [UUID(m.id) if isinstance(m, Meeting) else m for m in meetings]
         self.db.commit()
-        self.db.refresh(meeting)
         
-        logger.info(f"Cancelled meeting {meeting_id}")
+        logger.info(f"Confirmed {len(meeting_ids) - meeting_ids.count(None)} meetings for user {user_id}")
+        return meeting_ids
+    
+    def get_user_meeting_ids(self, user_id: UUID, meeting_ids: Iterable[UUID]) -> Set[UUID]:
+        """
+        Filter meeting IDs down to those that exist and belong to a user
+        
+        Args:
+            user_id: Owner's user UUID
+            meeting_ids: Candidate meeting UUIDs
+            
+        Returns:
+            The subset of meeting_ids owned by the user
+        """
+        meeting_ids = list(meeting_ids)
+        if not meeting_ids:
+            return set()
+        
+        rows = self.db.execute(
+            select(Meeting.id).where(Meeting.id.in_(meeting_ids), Meeting.user_id == user_id)
+        ).scalars()
+        return {UUID(meeting_id) for meeting_id in rows}
+    
+    def cancel_meeting(self, meeting_id: UUID, user_id: UUID) -> Optional[Meeting]:
+        """
+        Cancel a meeting owned by a user
+        
+        Ownership check and status change run as a single UPDATE ... RETURNING
+        
+        Args:
+            meeting_id: Meeting UUID
+            user_id: Owner's user UUID
+            
+        Returns:
+            Updated Meeting object or None if not found for this user
+        """
+        stmt = (
+            update(Meeting)
+            .where(Meeting.id == meeting_id, Meeting.user_id == user_id)
+            .values(status="cancelled", updated_at=datetime.utcnow())
+            .returning(Meeting)
+            .execution_options(synchronize_session="fetch")
+        )
+        meeting = self.db.execute(stmt).scalar_one_or_none()
+        self.db.commit()
+        
+        if meeting:
+            logger.info(f"Cancelled meeting {meeting_id}")
         return meeting
     
     def delete_meeting(self, meeting_id: UUID) -> bool:
@@ -133,18 +231,38 @@ class MeetingService:
         Returns:
             True if deleted successfully
         """
-        # Convert UUID to string for SQLite comparison
-        meeting = self.db.query(Meeting).filter(Meeting.id == str(meeting_id)).first()
+        # Bulk deletes bypass ORM cascades, so remove participants explicitly
+        self.db.execute(delete(MeetingParticipant).where(MeetingParticipant.meeting_id == meeting_id))
+        deleted_id = self.db.execute(
+            delete(Meeting).where(Meeting.id == meeting_id).returning(Meeting.id)
+        ).scalar_one_or_none()
         
-        if not meeting:
+        if deleted_id is None:
+            self.db.rollback()
             raise ValueError(f"Meeting {meeting_id} not found")
         
-        self.db.delete(meeting)
         self.db.commit()
         
         logger.info(f"Deleted meeting {meeting_id} from database")
         return True
     
+    def get_meeting_id_by_event(self, event_id: str, user_id: UUID) -> Optional[str]:
+        """
+        Get the ID of the meeting linked to a calendar event
+        
+        Args:
+            event_id: Google Calendar event ID
+            user_id: User UUID (for authorization)
+            
+        Returns:
+            Meeting ID or None if no meeting matched
+        """
+        # Only the id is needed, so skip hydrating the Meeting
+        return self.db.query(Meeting.id).filter(
+            Meeting.event_id == event_id,
+            Meeting.user_id == user_id
+        ).scalar()
+    
     def get_user_meetings(
         self,
         user_id: UUID,
@@ -164,8 +282,7 @@ class MeetingService:
         Returns:
             List of Meeting objects
         """
-        # Convert UUID to string for SQLite comparison
-        query = self.db.query(Meeting).filter(Meeting.user_id == str(user_id))
+        query = self.db.query(Meeting).filter(Meeting.user_id == user_id)
         
         if status:
             query = query.filter(Meeting.status == status)
@@ -175,15 +292,18 @@ class MeetingService:
         logger.info(f"Retrieved {len(meetings)} meetings for user {user_id}")
         return meetings
     
-    def get_meeting_by_id(self, meeting_id: UUID) -> Optional[Meeting]:
+    def get_user_meeting(self, meeting_id: UUID, user_id: UUID) -> Optional[Meeting]:
         """
-        Get a meeting by ID
+        Get a meeting by ID if it belongs to a user
         
         Args:
             meeting_id: Meeting UUID
+            user_id: Owner's user UUID
             
         Returns:
             Meeting object or None
         """
-        # Convert UUID to string for SQLite comparison
-        return self.db.query(Meeting).filter(Meeting.id == str(meeting_id)).first()
+        return self.db.query(Meeting).filter(
+            Meeting.id == meeting_id,
+            Meeting.user_id == user_id
+        ).first()
@@ -2,17 +2,75 @@
 Slot Proposer Service
 Finds and ranks available meeting time slots
 """
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from itertools import islice
+from types import MappingProxyType
 from typing import List, Dict, Any, Tuple
 from uuid import UUID
+from cachetools import TTLCache
+import heapq
 import logging
 
 from app.schemas.slot import SlotSchema
 from app.schemas.intent import ParticipantSchema, TimeWindowSchema
 from app.services.google_calendar import GoogleCalendarService
+from app.utils.dates import parse_iso
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing response sections
+_EMPTY = MappingProxyType({})
+
+# Parsed busy periods per user, each user's cache keyed by (time_min, time_max);
+# absorbs repeated re-plans
+BUSY_PERIODS_TTL = 30
+_busy_periods_cache = TTLCache(maxsize=1024, ttl=BUSY_PERIODS_TTL)
+
+
+def _cache_busy_periods(user_id: UUID, key: tuple, busy_periods: List[Tuple[datetime, datetime]]) -> None:
+    """Store parsed busy periods; re-setting the user's entry renews its TTL"""
+    user_cache = _busy_periods_cache.get(user_id)
+    if user_cache is None:
+        user_cache = TTLCache(maxsize=16, ttl=BUSY_PERIODS_TTL)
+    user_cache[key] = busy_periods
+    _busy_periods_cache[user_id] = user_cache
+
+
+def invalidate_busy_periods(user_id: UUID) -> None:
+    """Drop cached busy periods for a user after their calendar changes"""
+    _busy_periods_cache.pop(user_id, None)
+
+
+# Slot grid step
+FIFTEEN_MINUTES = timedelta(minutes=15)
+
+
+def _ceil_to_15min(value: datetime) -> datetime:
+    """Round a datetime up to the next 15-minute boundary"""
+    # Window edges and busy ends are usually on the grid already; return those untouched
+    if value.minute % 15 or value.second or value.microsecond:
+        return value + timedelta(
+            minutes=15 - value.minute % 15,
+            seconds=-value.second,
+            microseconds=-value.microsecond
+        )
+    return value
+
+
+# Time of day preference (9 AM - 5 PM is ideal), indexed by hour
+_HOUR_FACTOR = tuple(1.0 if 9 <= h < 17 else 0.9 if h in (8, 17) else 0.7 for h in range(24))
+
+# Avoid Monday mornings and Friday afternoons, indexed by [weekday][hour]
+_WEEKDAY_HOUR_FACTOR = tuple(
+    tuple(0.85 if (weekday == 0 and h < 10) or (weekday == 4 and h >= 15) else 1.0 for h in range(24))
+    for weekday in range(7)
+)
+
+# Hours from the reference time: too soon, same day, next day, further out
+_PROXIMITY_HOURS = (2, 24, 48)
+_PROXIMITY_FACTOR = (0.8, 1.0, 0.95, 0.9)
+
 
 class SlotProposerService:
     """Service for proposing available meeting slots"""
@@ -39,55 +97,80 @@ class SlotProposerService:
         Returns:
             List of 2-3 proposed slots, ranked by score
         """
-        all_slots = []
+        if not preferred_windows:
+            return []
         
-        for window in preferred_windows:
-            # Get busy periods for the user
+        # Get busy periods for the user with one query over all windows
+        time_min = min(window.start for window in preferred_windows)
+        time_max = max(window.end for window in preferred_windows)
+        cache_key = (time_min, time_max)
+        
+        busy_periods = _busy_periods_cache.get(user_id, _EMPTY).get(cache_key)
+        if busy_periods is None:
             try:
                 freebusy_data = self.calendar_service.get_freebusy(
                     user_id=user_id,
-                    time_min=window.start,
-                    time_max=window.end
+                    time_min=time_min,
+                    time_max=time_max
                 )
                 
                 busy_periods = self._extract_busy_periods(freebusy_data)
+                _cache_busy_periods(user_id, cache_key, busy_periods)
                 
             except Exception as e:
                 logger.warning(f"Failed to get FreeBusy data: {e}")
                 busy_periods = []
-            
+        
+        # Merged periods are ordered by both start and end, so each window's share is a bisected slice
+        busy_starts = [start for start, _ in busy_periods]
+        busy_ends = [end for _, end in busy_periods]
+        
+        all_slots = []
+        
+        for window in preferred_windows:
             # Find free slots in this window
             window_slots = self._find_free_slots(
                 window.start,
                 window.end,
-                busy_periods,
+                busy_periods[bisect_right(busy_ends, window.start):bisect_left(busy_starts, window.end)],
                 duration_minutes
             )
             
             all_slots.extend(window_slots)
         
-        # Score and rank slots
-        scored_slots = [self._score_slot(slot, preferred_windows[0].start) for slot in all_slots]
-        scored_slots.sort(key=lambda x: x.score, reverse=True)
+        # Score every candidate as a plain float, then select the top 3 indices (earliest wins ties)
+        reference_time = preferred_windows[0].start
+        scores = [self._score_slot(start, reference_time) for start, _ in all_slots]
+        top = heapq.nlargest(3, range(len(scores)), key=scores.__getitem__)
         
-        # Return top 2-3 slots
-        return scored_slots[:3] if len(scored_slots) >= 3 else scored_slots[:2] if len(scored_slots) >= 2 else scored_slots
+        # Return top 2-3 slots; only the winners are built as SlotSchema
+        return [
+            SlotSchema(start=all_slots[i][0], end=all_slots[i][1], score=scores[i], conflicts=[])
+            for i in top
+        ]
     
     def _extract_busy_periods(self, freebusy_data: Dict[str, Any]) -> List[Tuple[datetime, datetime]]:
-        """Extract busy periods from FreeBusy API response"""
-        busy_periods = []
-        
-        calendars = freebusy_data.get("calendars", {})
-        for calendar_id, calendar_data in calendars.items():
-            for busy in calendar_data.get("busy", []):
-                start = datetime.fromisoformat(busy["start"].replace("Z", "+00:00"))
-                end = datetime.fromisoformat(busy["end"].replace("Z", "+00:00"))
-                busy_periods.append((start, end))
+        """Extract busy periods from FreeBusy API response, sorted and merged"""
+        calendars = freebusy_data.get("calendars", _EMPTY)
+        busy_periods = [
+            (parse_iso(busy["start"]), parse_iso(busy["end"]))
+            for calendar_data in calendars.values()
+            for busy in calendar_data.get("busy", ())
+        ]
         
         # Sort by start time
         busy_periods.sort(key=lambda x: x[0])
         
-        return busy_periods
+        # Coalesce overlapping/adjacent busy periods
+        merged = busy_periods[:1]
+        for busy_start, busy_end in islice(busy_periods, 1, None):
+            if busy_start <= merged[-1][1]:
+                if busy_end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], busy_end)
+            else:
+                merged.append((busy_start, busy_end))
+        
+        return merged
     
     def _find_free_slots(
         self,
@@ -95,64 +178,28 @@ class SlotProposerService:
         window_end: datetime,
         busy_periods: List[Tuple[datetime, datetime]],
         duration_minutes: int
-    ) -> List[SlotSchema]:
-        """Find free slots within a time window"""
+    ) -> List[Tuple[datetime, datetime]]:
+        """Find free (start, end) slots within a time window"""
         slots = []
         duration = timedelta(minutes=duration_minutes)
         
-        # Start from the beginning of the window
-        current = window_start
+        # Busy periods arrive sorted and merged; bracket them with the window edges
+        merged = [(window_start, window_start), *busy_periods, (window_end, window_end)]
         
-        # Align to 15-minute boundaries
-        if current.minute % 15 != 0:
-            current = current.replace(
-                minute=(current.minute // 15 + 1) * 15,
-                second=0,
-                microsecond=0
-            )
-        
-        while current + duration <= window_end:
-            slot_end = current + duration
-            
-            # Check if this slot overlaps with any busy period
-            is_free = True
-            for busy_start, busy_end in busy_periods:
-                if self._slots_overlap(current, slot_end, busy_start, busy_end):
-                    is_free = False
-                    # Jump to end of busy period
-                    current = busy_end
-                    # Align to next 15-minute boundary
-                    if current.minute % 15 != 0:
-                        current = current.replace(
-                            minute=(current.minute // 15 + 1) * 15,
-                            second=0,
-                            microsecond=0
-                        )
-                    break
-            
-            if is_free:
-                slots.append(SlotSchema(
-                    start=current,
-                    end=slot_end,
-                    score=0.0,  # Will be scored later
-                    conflicts=[]
-                ))
+        # Emit aligned slots in each gap between consecutive busy periods
+        for (_, prev_end), (next_start, _) in zip(merged, merged[1:]):
+            # Latest start that still fits the meeting before the gap closes
+            last_start = min(next_start, window_end) - duration
+            current = _ceil_to_15min(max(prev_end, window_start))
+            while current <= last_start:
+                slot_end = current + duration
+                slots.append((current, slot_end))
                 # Move to next 15-minute slot
-                current += timedelta(minutes=15)
+                current += FIFTEEN_MINUTES
             
         return slots
     
-    def _slots_overlap(
-        self,
-        slot_start: datetime,
-        slot_end: datetime,
-        busy_start: datetime,
-        busy_end: datetime
-    ) -> bool:
-        """Check if two time periods overlap"""
-        return slot_start < busy_end and slot_end > busy_start
-    
-    def _score_slot(self, slot: SlotSchema, reference_time: datetime) -> SlotSchema:
+    def _score_slot(self, start: datetime, reference_time: datetime) -> float:
         """
         Score a slot based on various factors
         
@@ -161,34 +208,11 @@ class SlotProposerService:
         - Slots closer to reference time get higher scores
         - Slots during typical business hours get higher scores
         """
-        score = 1.0
-        
-        # Time of day preference (9 AM - 5 PM is ideal)
-        hour = slot.start.hour
-        if 9 <= hour < 17:
-            score *= 1.0
-        elif 8 <= hour < 9 or 17 <= hour < 18:
-            score *= 0.9
-        else:
-            score *= 0.7
+        hour = start.hour
         
         # Proximity to reference time (sooner is better, but not too soon)
-        time_diff = (slot.start - reference_time).total_seconds() / 3600  # hours
-        if time_diff < 2:
-            score *= 0.8  # Too soon
-        elif time_diff < 24:
-            score *= 1.0  # Same day is great
-        elif time_diff < 48:
-            score *= 0.95  # Next day is good
-        else:
-            score *= 0.9  # Further out is okay
-        
-        # Avoid Monday mornings and Friday afternoons
-        weekday = slot.start.weekday()
-        if weekday == 0 and hour < 10:  # Monday morning
-            score *= 0.85
-        elif weekday == 4 and hour >= 15:  # Friday afternoon
-            score *= 0.85
-        
-        slot.score = min(score, 1.0)
-        return slot
+        time_diff = (start - reference_time).total_seconds() / 3600  # hours
+        proximity = _PROXIMITY_FACTOR[bisect_right(_PROXIMITY_HOURS, time_diff)]
+        
+        score = _HOUR_FACTOR[hour] * proximity * _WEEKDAY_HOUR_FACTOR[start.weekday()][hour]
+        return min(score, 1.0)
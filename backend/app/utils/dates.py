@@ -0,0 +1,28 @@
+"""
+Date Utilities
+Fast ISO 8601 parsing for Google Calendar and API timestamps
+"""
+from datetime import datetime
+from functools import lru_cache
+import sys
+
+
+if sys.version_info >= (3, 11):
+    # C-implemented and accepts a trailing 'Z' natively; memoized since
+    # the same hour-aligned event boundaries recur across requests
+    parse_iso = lru_cache(maxsize=4096)(datetime.fromisoformat)
+else:
+    @lru_cache(maxsize=4096)
+    def parse_iso(value: str) -> datetime:
+        """
+        Parse an ISO 8601 string, accepting a trailing 'Z' for UTC
+        
+        Args:
+            value: ISO 8601 datetime string
+            
+        Returns:
+            Parsed datetime
+        """
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
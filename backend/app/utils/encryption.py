@@ -2,8 +2,9 @@
 Encryption Utilities
 AES-256 encryption for sensitive data like OAuth tokens
 """
+from functools import lru_cache
 from cryptography.fernet import Fernet
-from app.config import settings
+from app.config import get_settings
 import base64
 
 
@@ -11,6 +12,8 @@ class EncryptionService:
     """Service for encrypting and decrypting sensitive data"""
     
     def __init__(self):
+        settings = get_settings()
+        
         # Ensure encryption key is properly formatted
         key = settings.encryption_key.encode() if isinstance(settings.encryption_key, str) else settings.encryption_key
         
@@ -22,6 +25,10 @@ class EncryptionService:
             # Generate a key from the provided string
             key = base64.urlsafe_b64encode(key.ljust(32)[:32])
             self.cipher = Fernet(key)
+        
+        # Bound once so each call skips the cipher attribute lookup
+        self._encrypt = self.cipher.encrypt
+        self._decrypt = self.cipher.decrypt
     
     def encrypt(self, data: str) -> str:
         """
@@ -36,8 +43,7 @@ class EncryptionService:
         if not data:
             return ""
         
-        encrypted_bytes = self.cipher.encrypt(data.encode())
-        return encrypted_bytes.decode()
+        return self._encrypt(data.encode()).decode()
     
     def decrypt(self, encrypted_data: str) -> str:
         """
@@ -52,9 +58,13 @@ class EncryptionService:
         if not encrypted_data:
             return ""
         
-        decrypted_bytes = self.cipher.decrypt(encrypted_data.encode())
-        return decrypted_bytes.decode()
+        return self._decrypt(encrypted_data.encode()).decode()
 
 
-# Global encryption service instance
-encryption_service = EncryptionService()
+@lru_cache(maxsize=1)
+def get_encryption_service() -> EncryptionService:
+    """
+    Get the shared encryption service
+    Created on first use so importing the app does not require settings
+    """
+    return EncryptionService()
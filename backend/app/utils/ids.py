@@ -0,0 +1,29 @@
+"""
+ID Utilities
+Time-ordered UUIDs for primary keys
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7 (RFC 9562)
+    
+    The leading 48 bits are the Unix timestamp in milliseconds, so IDs sort
+    by creation time and new rows land at the tail of the primary-key index
+    
+    Returns:
+        Time-ordered UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # Version 7
+    value |= (rand >> 62 & 0xFFF) << 64  # rand_a (12 bits)
+    value |= 0b10 << 62  # RFC 4122 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b (62 bits)
+    
+    return uuid.UUID(int=value)
@@ -2,12 +2,23 @@
 JWT Utilities
 Token generation and validation for session management
 """
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from jose import JWTError, jwt
 from uuid import UUID
 
-from app.config import settings
+from app.config import get_settings
+
+@lru_cache(maxsize=1)
+def _signing_params() -> Tuple[bytes, str, List[str]]:
+    """
+    Signing key, algorithm and decode allow-list
+    Resolved on first use and shared by every token operation;
+    python-jose expects the allow-list as a list
+    """
+    settings = get_settings()
+    return settings.secret_key.encode(), settings.jwt_algorithm, [settings.jwt_algorithm]
 
 
 def create_access_token(user_id: UUID, expires_delta: Optional[timedelta] = None) -> str:
@@ -21,21 +32,23 @@ def create_access_token(user_id: UUID, expires_delta: Optional[timedelta] = None
     Returns:
         JWT token string
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expiration_minutes)
+    settings = get_settings()
+    
+    # One clock read shared by exp and iat
+    now = datetime.now(timezone.utc)
     
     to_encode = {
         "sub": str(user_id),
-        "exp": expire,
-        "iat": datetime.utcnow()
+        "exp": now + (expires_delta or timedelta(minutes=settings.jwt_expiration_minutes)),
+        "iat": now
     }
     
+    secret, algorithm, _ = _signing_params()
+    
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.secret_key,
-        algorithm=settings.jwt_algorithm
+        secret,
+        algorithm=algorithm
     )
     
     return encoded_jwt
@@ -51,15 +64,31 @@ def decode_access_token(token: str) -> Optional[UUID]:
     Returns:
         User UUID if valid, None otherwise
     """
+    decoded = decode_access_token_with_expiry(token)
+    return decoded[0] if decoded else None
+
+
+def decode_access_token_with_expiry(token: str) -> Optional[Tuple[UUID, Optional[int]]]:
+    """
+    Decode and validate a JWT access token, keeping its expiry
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        (User UUID, expiry as a Unix timestamp) if valid, None otherwise
+    """
+    secret, _, algorithms = _signing_params()
+    
     try:
         payload = jwt.decode(
             token,
-            settings.secret_key,
-            algorithms=[settings.jwt_algorithm]
+            secret,
+            algorithms=algorithms
         )
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
-        return UUID(user_id)
+        return UUID(user_id), payload.get("exp")
     except JWTError:
         return None
@@ -4,24 +4,72 @@ Main entry point for the API server
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from pathlib import Path
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
 import os
 from dotenv import load_dotenv
 
-from app.database import engine, Base
+from app.database import get_engine, Base
 from app.routes import auth, scheduling, meetings
+from app.services.google_calendar import close_async_client
 
 # Load environment variables
 load_dotenv()
 
+# Allowed CORS origins, parsed once from a comma-separated FRONTEND_URL
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("FRONTEND_URL", "http://localhost:3000").split(",")
+    if origin.strip()
+)
+
+
+# Migration scripts, used to check the database against the latest revision
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "alembic"
+
+
+def ensure_schema() -> None:
+    """
+    Create the schema on an empty database, or verify an existing one is migrated
+    
+    create_all never adds indexes or constraints to tables that already exist,
+    so an existing database must be brought up to date with Alembic instead.
+    
+    Raises:
+        RuntimeError: If the database is not at the latest migration
+    """
+    script = ScriptDirectory(str(MIGRATIONS_DIR))
+    head = script.get_current_head()
+    
+    with get_engine().begin() as connection:
+        context = MigrationContext.configure(connection)
+        current = context.get_current_revision()
+        
+        if current is None and not inspect(connection).get_table_names():
+            # Fresh database: create everything and record it as current
+            Base.metadata.create_all(bind=connection)
+            context.stamp(script, head)
+            return
+    
+    if current != head:
+        raise RuntimeError(
+            f"Database schema is at revision {current or 'none'}, expected {head}. "
+            "Run `alembic upgrade head` in backend/ before starting the server."
+        )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    # Startup: Create database tables
-    Base.metadata.create_all(bind=engine)
+    # Startup: create tables on a fresh database, fail fast on an outdated one
+    ensure_schema()
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: close pooled Google API connections
+    await close_async_client()
 
 
 # Initialize FastAPI app
@@ -29,13 +77,14 @@ app = FastAPI(
     title="SmartMeet API",
     description="AI-powered meeting scheduler with Google Calendar integration",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[os.getenv("FRONTEND_URL", "http://localhost:3000")],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
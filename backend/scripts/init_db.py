@@ -5,13 +5,13 @@ Creates all tables from models
 import sys
 sys.path.append(".")
 
-from app.database import Base, engine
-from app.models import User, AuthToken, Meeting
+from app.database import Base, get_engine
+from app.models import User, AuthToken, Meeting, MeetingParticipant
 
 def init_db():
     """Create all database tables"""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     print("Database tables created successfully!")
 
 if __name__ == "__main__":
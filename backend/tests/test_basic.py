@@ -4,12 +4,11 @@ Simple tests to verify setup and core functionality
 """
 import pytest
 from fastapi.testclient import TestClient
-import sys
-sys.path.append(".")
 
 from main import app
-from app.utils.encryption import encryption_service
+from app.utils.encryption import get_encryption_service
 from app.utils.jwt import create_access_token, decode_access_token
+from app.utils.ids import uuid7
 from uuid import uuid4
 
 
@@ -33,8 +32,8 @@ def test_health_check():
 def test_encryption_roundtrip():
     """Test encryption and decryption"""
     original = "test_secret_token_12345"
-    encrypted = encryption_service.encrypt(original)
-    decrypted = encryption_service.decrypt(encrypted)
+    encrypted = get_encryption_service().encrypt(original)
+    decrypted = get_encryption_service().decrypt(encrypted)
     
     assert encrypted != original
     assert decrypted == original
@@ -57,6 +56,16 @@ def test_invalid_jwt():
     assert result is None
 
 
+def test_uuid7_is_time_ordered():
+    """Test generated IDs are version 7 and sort by creation time"""
+    ids = [uuid7() for _ in range(100)]
+    
+    assert all(i.version == 7 for i in ids)
+    # Leading 48 bits are the millisecond timestamp
+    timestamps = [i.int >> 80 for i in ids]
+    assert timestamps == sorted(timestamps)
+
+
 def test_google_login_endpoint():
     """Test Google login endpoint returns auth URL"""
     response = client.get("/auth/google/login")
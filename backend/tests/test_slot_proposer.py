@@ -0,0 +1,116 @@
+"""
+Slot Proposer Tests
+Free-slot sweep, 15-minute alignment and ranking
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.schemas.intent import TimeWindowSchema
+from app.services.slot_proposer import SlotProposerService, _ceil_to_15min
+
+
+def at(hour, minute=0, day=13):
+    """UTC datetime on a Tuesday in October 2026"""
+    return datetime(2026, 10, day, hour, minute, tzinfo=timezone.utc)
+
+
+class FakeCalendarService:
+    """Returns fixed FreeBusy data and records each query"""
+    
+    def __init__(self, busy):
+        self.busy = busy
+        self.calls = []
+    
+    def get_freebusy(self, user_id, time_min, time_max):
+        self.calls.append((time_min, time_max))
+        return {
+            "calendars": {
+                "primary": {
+                    "busy": [
+                        {"start": start.isoformat(), "end": end.isoformat()}
+                        for start, end in self.busy
+                    ]
+                }
+            }
+        }
+
+
+def free_starts(busy, window_start, window_end, duration_minutes=30):
+    """Start times of the free slots found in one window"""
+    proposer = SlotProposerService(FakeCalendarService([]))
+    busy_periods = proposer._extract_busy_periods(
+        FakeCalendarService(busy).get_freebusy(None, window_start, window_end)
+    )
+    return [
+        start for start, _ in
+        proposer._find_free_slots(window_start, window_end, busy_periods, duration_minutes)
+    ]
+
+
+def test_ceil_to_15min_rounds_up_late_minutes():
+    """Minutes :46-:59 roll over into the next hour instead of minute=60"""
+    assert _ceil_to_15min(at(10, 46)) == at(11)
+    assert _ceil_to_15min(at(10, 59) + timedelta(seconds=59)) == at(11)
+    assert _ceil_to_15min(at(23, 50)) == at(0, day=14)
+
+
+def test_ceil_to_15min_keeps_aligned_and_rounds_seconds():
+    """Aligned values are unchanged; any sub-minute remainder rounds up"""
+    assert _ceil_to_15min(at(10, 30)) == at(10, 30)
+    assert _ceil_to_15min(at(10, 30) + timedelta(microseconds=1)) == at(10, 45)
+
+
+def test_overlapping_and_adjacent_busy_periods_are_merged():
+    """Overlapping and back-to-back meetings leave no gap between them"""
+    busy = [
+        (at(9, 30), at(10)),
+        (at(9, 45), at(10, 20)),
+        (at(10, 20), at(10, 50)),
+    ]
+    assert free_starts(busy, at(9), at(11, 30)) == [at(9), at(11)]
+
+
+def test_busy_period_ending_late_in_hour_resumes_on_next_hour():
+    """A busy end at :50 realigns to the next hour"""
+    assert free_starts([(at(9), at(9, 50))], at(9), at(10, 45)) == [at(10), at(10, 15)]
+
+
+def test_find_slots_returns_top_three_with_earliest_on_ties():
+    """Best scores first; equal scores keep chronological order"""
+    proposer = SlotProposerService(FakeCalendarService([]))
+    
+    slots = proposer.find_slots(
+        user_id=uuid4(),
+        participants=[],
+        duration_minutes=30,
+        preferred_windows=[TimeWindowSchema(start=at(9), end=at(13))]
+    )
+    
+    # Slots under two hours from the window start score lower; from 11:00 on they tie
+    assert [slot.start for slot in slots] == [at(11), at(11, 15), at(11, 30)]
+    assert all(slot.score == 1.0 for slot in slots)
+
+
+def test_find_slots_queries_freebusy_once_across_windows():
+    """One FreeBusy query covers every window; each window only sees its own busy time"""
+    calendar = FakeCalendarService([(at(9), at(12, 30)), (at(9, day=14), at(12, 45, day=14))])
+    proposer = SlotProposerService(calendar)
+    
+    slots = proposer.find_slots(
+        user_id=uuid4(),
+        participants=[],
+        duration_minutes=60,
+        preferred_windows=[
+            TimeWindowSchema(start=at(9), end=at(13, 30)),
+            TimeWindowSchema(start=at(9, day=14), end=at(14, day=14)),
+        ]
+    )
+    
+    assert calendar.calls == [(at(9), at(14, day=14))]
+    assert sorted(slot.start for slot in slots) == [at(12, 30), at(12, 45, day=14), at(13, day=14)]
+
+
+def test_find_slots_without_windows_returns_nothing():
+    """No preferred windows means no candidates rather than an error"""
+    proposer = SlotProposerService(FakeCalendarService([]))
+    assert proposer.find_slots(uuid4(), [], 30, []) == []
@@ -10,8 +10,9 @@ meetings = [
 ]
 
 st.header("Upcoming Meetings")
-for meeting in meetings:
-    st.subheader(meeting["title"])
-    st.write(f"Time: {meeting['time']}")
+# Render the whole list in one element instead of two per meeting
+st.markdown("\n\n".join(
+    f"### {meeting['title']}\nTime: {meeting['time']}" for meeting in meetings
+))
 
 # You can add more features, like scheduling a meeting, user login, etc.